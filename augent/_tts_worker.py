@@ -0,0 +1,52 @@
+"""
+TTS worker subprocess.
+
+Run as `python -m augent._tts_worker`. Reads one JSON object from stdin
+with the keys text, voice, output_dir, output_filename, speed and
+file_path, runs TTS with fds 1/2 pointed at devnull (Kokoro prints
+progress from C code), then writes the result JSON to the real stdout.
+
+Shipping this as a module instead of generating a tempfile script per
+job lets Python cache the bytecode and avoids repr-quoting the text.
+"""
+
+import json
+import os
+import sys
+
+
+def main() -> None:
+    args = json.loads(sys.stdin.readline())
+
+    real_stdout = os.dup(1)
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.dup2(devnull, 2)
+    os.close(devnull)
+
+    # Import after silencing so library banners go to devnull too
+    from augent.tts import read_aloud, text_to_speech
+
+    try:
+        if args.get("file_path"):
+            result = read_aloud(
+                args["file_path"], voice=args["voice"], speed=args["speed"]
+            )
+        else:
+            result = text_to_speech(
+                text=args["text"],
+                voice=args["voice"],
+                output_dir=args["output_dir"],
+                output_filename=args["output_filename"],
+                speed=args["speed"],
+            )
+    except Exception as e:
+        result = {"error": str(e)}
+
+    os.dup2(real_stdout, 1)
+    os.close(real_stdout)
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -36,6 +36,7 @@ def transcribe_audio(
     device: str = "auto",
     compute_type: str = "auto",
     language: Optional[str] = None,
+    vad_filter: bool = True,
 ) -> Dict[str, Any]:
     """
     Transcribe an audio file using faster-whisper.
@@ -47,6 +48,7 @@ def transcribe_audio(
         device: Device to use (auto, cpu, cuda)
         compute_type: Compute type (auto, float16, int8)
         language: Force specific language (None for auto-detect)
+        vad_filter: Skip non-speech regions with Silero VAD (default True)
 
     Returns:
         dict with keys: text, language, duration, segments, words
@@ -70,7 +72,10 @@ def transcribe_audio(
     model_cache = get_model_cache()
     model = model_cache.get(model_size, device, compute_type)
 
-    transcribe_options = {"word_timestamps": True, "vad_filter": True}
+    transcribe_options = {"word_timestamps": True, "vad_filter": vad_filter}
+    if vad_filter:
+        # Drop pauses >500ms so encoder time scales with speech, not file length
+        transcribe_options["vad_parameters"] = {"min_silence_duration_ms": 500}
     if language:
         transcribe_options["language"] = language
 
@@ -112,6 +117,7 @@ def transcribe_audio_streaming(
     device: str = "auto",
     compute_type: str = "auto",
     language: Optional[str] = None,
+    vad_filter: bool = True,
     on_progress: Optional[Callable[[TranscriptionProgress], None]] = None,
 ) -> Generator[TranscriptionProgress, None, Dict[str, Any]]:
     """Transcribe audio with streaming progress updates."""
@@ -155,7 +161,10 @@ def transcribe_audio_streaming(
         on_progress(progress)
     yield progress
 
-    transcribe_options = {"word_timestamps": True, "vad_filter": True}
+    transcribe_options = {"word_timestamps": True, "vad_filter": vad_filter}
+    if vad_filter:
+        # Drop pauses >500ms so encoder time scales with speech, not file length
+        transcribe_options["vad_parameters"] = {"min_silence_duration_ms": 500}
     if language:
         transcribe_options["language"] = language
 
@@ -223,6 +232,7 @@ def search_audio(
     keywords: List[str],
     model_size: str = "tiny",
     use_cache: bool = True,
+    compute_type: str = "auto",
 ) -> Dict[str, List[Dict]]:
     """
     Main function: transcribe audio and search for keywords.
@@ -232,11 +242,14 @@ def search_audio(
         keywords: List of keywords to search for
         model_size: Whisper model size
         use_cache: Use cached transcription
+        compute_type: Compute type (auto, float16, int8)
 
     Returns:
         dict grouped by keyword with matches
     """
-    transcription = transcribe_audio(audio_path, model_size, use_cache=use_cache)
+    transcription = transcribe_audio(
+        audio_path, model_size, use_cache=use_cache, compute_type=compute_type
+    )
 
     matches = find_keyword_matches(transcription["words"], keywords)
 
@@ -261,9 +274,12 @@ def search_audio_full(
     keywords: List[str],
     model_size: str = "tiny",
     use_cache: bool = True,
+    compute_type: str = "auto",
 ) -> Dict[str, Any]:
     """Full output including transcription metadata."""
-    transcription = transcribe_audio(audio_path, model_size, use_cache=use_cache)
+    transcription = transcribe_audio(
+        audio_path, model_size, use_cache=use_cache, compute_type=compute_type
+    )
 
     matches = find_keyword_matches(transcription["words"], keywords)
 
@@ -324,9 +340,12 @@ def search_audio_proximity(
     max_distance: int = 30,
     model_size: str = "tiny",
     use_cache: bool = True,
+    compute_type: str = "auto",
 ) -> List[Dict]:
     """Find where keyword1 appears near keyword2."""
-    transcription = transcribe_audio(audio_path, model_size, use_cache=use_cache)
+    transcription = transcribe_audio(
+        audio_path, model_size, use_cache=use_cache, compute_type=compute_type
+    )
 
     return search_with_proximity(
         transcription["words"], keyword1, keyword2, max_distance
@@ -55,8 +55,9 @@ def _get_embedding_model_cache() -> EmbeddingModelCache:
 
 
 def _cosine_similarity(query: np.ndarray, embeddings: np.ndarray) -> np.ndarray:
-    """Compute cosine similarity between a query vector and a matrix of embeddings."""
-    dot = np.dot(embeddings, query.T).flatten()
+    """Compute cosine similarity between a 1-D query vector and a matrix of embeddings."""
+    query = np.ascontiguousarray(query, dtype=np.float32).ravel()
+    dot = embeddings @ query
     norm_q = np.linalg.norm(query)
     norm_e = np.linalg.norm(embeddings, axis=1)
     return dot / (norm_q * norm_e + 1e-8)
@@ -145,9 +146,7 @@ def _ranked_semantic_search(
     Each entry in segments_meta must have: seg, seg_idx, file_segments.
     Optional keys: title, file_path (included in results when present).
     """
-    similarities = _cosine_similarity(
-        query_embedding.reshape(1, -1), segment_embeddings
-    )
+    similarities = _cosine_similarity(query_embedding, segment_embeddings)
 
     # Overcollect candidates when dedup is on
     candidate_k = (
@@ -213,20 +212,50 @@ def _ranked_semantic_search(
 
 
 def _get_or_compute_embeddings(
-    segments: List[Dict], audio_hash: str, model_name: str = EMBEDDING_MODEL
-) -> np.ndarray:
-    """Get embeddings from memory or compute them."""
+    segments: List[Dict],
+    audio_hash: str,
+    model_name: str = EMBEDDING_MODEL,
+    extra_texts: Optional[List[str]] = None,
+):
+    """Get embeddings from memory or compute them.
+
+    When extra_texts is provided (e.g. a search query), returns
+    (segment_embeddings, extra_embeddings). On a cache miss the extra texts
+    ride along in the same encode batch as the segments, so encoding them
+    costs no additional model invocation; on a cache hit only the extra
+    texts are encoded.
+    """
     memory = get_transcription_memory()
 
     # Check memory
     stored = memory.get_embeddings(audio_hash, model_name)
     if stored is not None:
-        return stored["embeddings"]
+        if extra_texts is None:
+            return stored["embeddings"]
+        model = _get_embedding_model_cache().get(model_name)
+        extra_embeddings = model.encode(
+            list(extra_texts), convert_to_numpy=True, show_progress_bar=False
+        )
+        return stored["embeddings"], extra_embeddings
 
-    # Compute embeddings
+    # Compute embeddings (extra texts prepended so one batch covers both).
+    # Whisper often emits identical filler/silence segments — encode each
+    # unique text once and scatter the results back.
     model = _get_embedding_model_cache().get(model_name)
     texts = [seg["text"].strip() for seg in segments]
-    embeddings = model.encode(texts, convert_to_numpy=True, show_progress_bar=False)
+    unique_texts, inverse = np.unique(
+        np.array(texts, dtype=object), return_inverse=True
+    )
+    n_extra = len(extra_texts) if extra_texts else 0
+    encoded = model.encode(
+        list(extra_texts) + list(unique_texts) if n_extra else list(unique_texts),
+        convert_to_numpy=True,
+        show_progress_bar=False,
+    )
+    # Normalize rows so cosine similarity reduces to a dot product downstream
+    encoded = encoded / (np.linalg.norm(encoded, axis=1, keepdims=True) + 1e-8)
+    extra_embeddings = encoded[:n_extra]
+    embeddings = encoded[n_extra:][inverse]
 
     # Store them
     memory.set_embeddings(
@@ -235,9 +264,12 @@ def _get_or_compute_embeddings(
         embeddings,
         segment_count=len(segments),
         embedding_dim=embeddings.shape[1],
+        normalized=True,
     )
 
-    return embeddings
+    if extra_texts is None:
+        return embeddings
+    return embeddings, extra_embeddings
 
 
 def _write_results_csv(results: List[Dict], output_path: str, query: str) -> str:
@@ -356,7 +388,7 @@ def semantic_tag(
     matched_tags = []
     for i, tag_name in enumerate(tag_names):
         query_emb = tag_embeddings[i]
-        sims = _cosine_similarity(query_emb.reshape(1, -1), seg_embeddings)
+        sims = _cosine_similarity(query_emb, seg_embeddings)
         # Use the average of top-5 segment scores (captures topic presence without
         # requiring the whole transcript to be about it)
         top_scores = sorted(sims, reverse=True)[:5]
@@ -411,14 +443,12 @@ def deep_search(
     memory = get_transcription_memory()
     audio_hash = memory.hash_audio_file(audio_path)
 
-    # Get or compute segment embeddings
-    segment_embeddings = _get_or_compute_embeddings(segments, audio_hash)
-
-    # Encode query
-    model = _get_embedding_model_cache().get()
-    query_embedding = model.encode(
-        query, convert_to_numpy=True, show_progress_bar=False
+    # Get or compute segment embeddings; the query rides along in the same
+    # encode batch when the segments aren't cached yet
+    segment_embeddings, query_batch = _get_or_compute_embeddings(
+        segments, audio_hash, extra_texts=[query]
     )
+    query_embedding = query_batch[0]
 
     # Build metadata list for shared ranking function
     segments_meta = [
@@ -676,13 +706,16 @@ def detect_chapters(
     # Get or compute segment embeddings
     embeddings = _get_or_compute_embeddings(segments, audio_hash)
 
-    # Compute similarity between consecutive segments
-    similarities = []
-    for i in range(len(embeddings) - 1):
-        sim = _cosine_similarity(
-            embeddings[i].reshape(1, -1), embeddings[i + 1].reshape(1, -1)
-        )[0]
-        similarities.append(float(sim))
+    # Compute similarity between consecutive segments in one vectorized pass.
+    # When stored embeddings are unit-length the norms are all 1, so the
+    # cosine collapses to a plain row-wise dot product.
+    stored = memory.get_embeddings(audio_hash, EMBEDDING_MODEL)
+    if stored is not None and stored.get("normalized"):
+        similarities = np.einsum("ij,ij->i", embeddings[:-1], embeddings[1:])
+    else:
+        dots = np.einsum("ij,ij->i", embeddings[:-1], embeddings[1:])
+        norms = np.linalg.norm(embeddings, axis=1)
+        similarities = dots / (norms[:-1] * norms[1:] + 1e-8)
 
     # Find boundaries where similarity drops below threshold
     boundaries = [0]
@@ -10,43 +10,149 @@ Supports:
 """
 
 import csv
+import functools
 import io
 import json
 import re
+from collections import defaultdict
 from typing import Dict, List, Optional
 
+# orjson serializes several times faster than stdlib json and handles
+# indentation natively; fall back to the stdlib when it isn't installed
+try:
+    import orjson
+
+    def _dumps(obj, indent: bool = False) -> str:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode()
+
+except ImportError:
+
+    def _dumps(obj, indent: bool = False) -> str:
+        if indent:
+            return json.dumps(obj, indent=2, ensure_ascii=False)
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+@functools.lru_cache(maxsize=64)
+def _combined_kw_pattern(keywords: tuple) -> "re.Pattern":
+    """Compile one alternation pattern covering all keywords in a set."""
+    return re.compile("|".join(re.escape(k) for k in keywords), re.IGNORECASE)
+
+
+def _bold(match: "re.Match") -> str:
+    """Wrap a keyword match in <b> tags, preserving original casing."""
+    return f"<b>{match.group(0)}</b>"
+
+
+_ELLIPSIS_RE = re.compile(r"\.{3,}")
+
+
+def _clean_snippet(snippet: str) -> str:
+    """Strip ellipsis markers and surrounding whitespace from a snippet."""
+    return _ELLIPSIS_RE.sub("", snippet).strip() if snippet else ""
+
+
+_CSV_HEADER = (
+    "keyword",
+    "timestamp",
+    "timestamp_seconds",
+    "snippet",
+    "confidence",
+    "match_type",
+)
+
+
+def _format_timestamps_bulk(times: List[float], sep: str) -> List[str]:
+    """Format a batch of times as HH:MM:SS<sep>mmm in one vectorized pass.
+
+    Moves the per-timestamp integer math into NumPy so large segment lists
+    don't pay Python call overhead twice per segment.
+    """
+    import numpy as np
+
+    t = (np.asarray(times, dtype=np.float64) * 1000).astype(np.int64)
+    hours, rem = np.divmod(t, 3_600_000)
+    minutes, rem = np.divmod(rem, 60_000)
+    secs, millis = np.divmod(rem, 1000)
+    return [
+        f"{h:02d}:{m:02d}:{s:02d}{sep}{ms:03d}"
+        # strict=False: all four arrays come from divmod on the same input
+        for h, m, s, ms in zip(
+            hours.tolist(),
+            minutes.tolist(),
+            secs.tolist(),
+            millis.tolist(),
+            strict=False,
+        )
+    ]
+
+
+@functools.lru_cache(maxsize=4096)
+def _srt_ts_cached(ms: int) -> str:
+    """Format integer milliseconds as HH:MM:SS,mmm (cached per unique time)."""
+    secs_total, millis = divmod(ms, 1000)
+    mins_total, secs = divmod(secs_total, 60)
+    hours, minutes = divmod(mins_total, 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _vtt_ts_cached(ms: int) -> str:
+    """Format integer milliseconds as HH:MM:SS.mmm (cached per unique time)."""
+    secs_total, millis = divmod(ms, 1000)
+    mins_total, secs = divmod(secs_total, 60)
+    hours, minutes = divmod(mins_total, 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
+
 
 def format_srt_timestamp(seconds: float) -> str:
     """Convert seconds to SRT timestamp format (HH:MM:SS,mmm)."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds % 1) * 1000)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+    # Quantize to milliseconds so float noise doesn't defeat the cache
+    return _srt_ts_cached(int(seconds * 1000))
 
 
 def format_vtt_timestamp(seconds: float) -> str:
     """Convert seconds to VTT timestamp format (HH:MM:SS.mmm)."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds % 1) * 1000)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
+    # Quantize to milliseconds so float noise doesn't defeat the cache
+    return _vtt_ts_cached(int(seconds * 1000))
 
 
 def format_simple_timestamp(seconds: float) -> str:
     """Convert seconds to simple mm:ss format."""
-    mins = int(seconds // 60)
-    secs = int(seconds % 60)
+    mins, secs = divmod(int(seconds), 60)
     return f"{mins}:{secs:02d}"
 
 
+def _matches_to_subtitle(
+    matches: List[Dict], duration: float, ts_fn, header: str = ""
+) -> str:
+    """Shared SRT/VTT match-entry builder, parameterized on timestamp format."""
+    buf = io.StringIO()
+    if header:
+        buf.write(header)
+    w = buf.write
+
+    for i, match in enumerate(matches, 1):
+        start_sec = match.get("timestamp_seconds", 0)
+        keyword = match.get("keyword", "")
+        snippet = _clean_snippet(match.get("snippet", ""))
+        w(
+            f"{i}\n{ts_fn(start_sec)} --> {ts_fn(start_sec + duration)}"
+            f"\n[{keyword}] {snippet}\n\n"
+        )
+
+    return buf.getvalue()
+
+
 class Exporter:
     """Export transcriptions and matches to various formats."""
 
     @staticmethod
     def to_srt(
-        segments: List[Dict], highlight_keywords: Optional[List[str]] = None
+        segments: List[Dict],
+        highlight_keywords: Optional[List[str]] = None,
+        pre_stripped: bool = False,
     ) -> str:
         """
         Export transcription segments to SRT subtitle format.
@@ -54,34 +160,49 @@ class Exporter:
         Args:
             segments: List of segment dicts with 'start', 'end', 'text' keys
             highlight_keywords: Optional keywords to wrap in <b> tags
+            pre_stripped: Skip per-segment strip() when the caller knows the
+                text is already trimmed (e.g. faster-whisper output)
 
         Returns:
             SRT formatted string
         """
-        lines = []
-
-        for i, segment in enumerate(segments, 1):
-            start = format_srt_timestamp(segment["start"])
-            end = format_srt_timestamp(segment["end"])
-            text = segment["text"].strip()
-
-            # Highlight keywords if specified
-            if highlight_keywords:
-                for kw in highlight_keywords:
-                    # Case-insensitive replacement with bold tags
-                    pattern = re.compile(re.escape(kw), re.IGNORECASE)
-                    text = pattern.sub(f"<b>{kw}</b>", text)
+        # One combined alternation pattern: a single scan per segment
+        # regardless of keyword count
+        highlighter = (
+            _combined_kw_pattern(tuple(highlight_keywords))
+            if highlight_keywords
+            else None
+        )
 
-            lines.append(f"{i}")
-            lines.append(f"{start} --> {end}")
-            lines.append(text)
-            lines.append("")  # Blank line between entries
+        # Preformat all timestamps in two vectorized passes
+        starts = _format_timestamps_bulk([s["start"] for s in segments], ",")
+        ends = _format_timestamps_bulk([s["end"] for s in segments], ",")
+
+        # Preallocated parts list: no append amortization, and join makes
+        # one sized allocation for the whole document
+        parts = [""] * len(segments)
+        if highlighter is None:
+            # Fast path for raw transcript export: no regex branch per segment
+            for i, (segment, start, end) in enumerate(
+                zip(segments, starts, ends, strict=False)
+            ):
+                text = segment["text"] if pre_stripped else segment["text"].strip()
+                parts[i] = f"{i + 1}\n{start} --> {end}\n{text}\n"
+        else:
+            for i, (segment, start, end) in enumerate(
+                zip(segments, starts, ends, strict=False)
+            ):
+                text = segment["text"] if pre_stripped else segment["text"].strip()
+                text = highlighter.sub(_bold, text)
+                parts[i] = f"{i + 1}\n{start} --> {end}\n{text}\n"
 
-        return "\n".join(lines)
+        return "\n".join(parts)
 
     @staticmethod
     def to_vtt(
-        segments: List[Dict], highlight_keywords: Optional[List[str]] = None
+        segments: List[Dict],
+        highlight_keywords: Optional[List[str]] = None,
+        pre_stripped: bool = False,
     ) -> str:
         """
         Export transcription segments to WebVTT format.
@@ -89,29 +210,43 @@ class Exporter:
         Args:
             segments: List of segment dicts with 'start', 'end', 'text' keys
             highlight_keywords: Optional keywords to wrap in <b> tags
+            pre_stripped: Skip per-segment strip() when the caller knows the
+                text is already trimmed (e.g. faster-whisper output)
 
         Returns:
             VTT formatted string
         """
-        lines = ["WEBVTT", ""]
-
-        for i, segment in enumerate(segments, 1):
-            start = format_vtt_timestamp(segment["start"])
-            end = format_vtt_timestamp(segment["end"])
-            text = segment["text"].strip()
-
-            # Highlight keywords if specified
-            if highlight_keywords:
-                for kw in highlight_keywords:
-                    pattern = re.compile(re.escape(kw), re.IGNORECASE)
-                    text = pattern.sub(f"<b>{kw}</b>", text)
+        # One combined alternation pattern: a single scan per segment
+        # regardless of keyword count
+        highlighter = (
+            _combined_kw_pattern(tuple(highlight_keywords))
+            if highlight_keywords
+            else None
+        )
 
-            lines.append(f"{i}")
-            lines.append(f"{start} --> {end}")
-            lines.append(text)
-            lines.append("")
+        # Preformat all timestamps in two vectorized passes
+        starts = _format_timestamps_bulk([s["start"] for s in segments], ".")
+        ends = _format_timestamps_bulk([s["end"] for s in segments], ".")
+
+        # Preallocated parts list: no append amortization, and join makes
+        # one sized allocation for the whole document
+        parts = [""] * len(segments)
+        if highlighter is None:
+            # Fast path for raw transcript export: no regex branch per segment
+            for i, (segment, start, end) in enumerate(
+                zip(segments, starts, ends, strict=False)
+            ):
+                text = segment["text"] if pre_stripped else segment["text"].strip()
+                parts[i] = f"{i + 1}\n{start} --> {end}\n{text}\n"
+        else:
+            for i, (segment, start, end) in enumerate(
+                zip(segments, starts, ends, strict=False)
+            ):
+                text = segment["text"] if pre_stripped else segment["text"].strip()
+                text = highlighter.sub(_bold, text)
+                parts[i] = f"{i + 1}\n{start} --> {end}\n{text}\n"
 
-        return "\n".join(lines)
+        return "WEBVTT\n\n" + "\n".join(parts)
 
     @staticmethod
     def matches_to_srt(matches: List[Dict], duration: float = 5.0) -> str:
@@ -127,24 +262,7 @@ class Exporter:
         Returns:
             SRT formatted string
         """
-        lines = []
-
-        for i, match in enumerate(matches, 1):
-            start_sec = match.get("timestamp_seconds", 0)
-            end_sec = start_sec + duration
-
-            start = format_srt_timestamp(start_sec)
-            end = format_srt_timestamp(end_sec)
-
-            keyword = match.get("keyword", "")
-            snippet = match.get("snippet", "").replace("...", "").strip()
-
-            lines.append(f"{i}")
-            lines.append(f"{start} --> {end}")
-            lines.append(f"[{keyword}] {snippet}")
-            lines.append("")
-
-        return "\n".join(lines)
+        return _matches_to_subtitle(matches, duration, format_srt_timestamp)
 
     @staticmethod
     def matches_to_vtt(matches: List[Dict], duration: float = 5.0) -> str:
@@ -158,24 +276,9 @@ class Exporter:
         Returns:
             VTT formatted string
         """
-        lines = ["WEBVTT", ""]
-
-        for i, match in enumerate(matches, 1):
-            start_sec = match.get("timestamp_seconds", 0)
-            end_sec = start_sec + duration
-
-            start = format_vtt_timestamp(start_sec)
-            end = format_vtt_timestamp(end_sec)
-
-            keyword = match.get("keyword", "")
-            snippet = match.get("snippet", "").replace("...", "").strip()
-
-            lines.append(f"{i}")
-            lines.append(f"{start} --> {end}")
-            lines.append(f"[{keyword}] {snippet}")
-            lines.append("")
-
-        return "\n".join(lines)
+        return _matches_to_subtitle(
+            matches, duration, format_vtt_timestamp, header="WEBVTT\n\n"
+        )
 
     @staticmethod
     def to_csv(matches: List[Dict]) -> str:
@@ -189,32 +292,26 @@ class Exporter:
             CSV formatted string
         """
         output = io.StringIO()
-        writer = csv.writer(output)
+        # \n terminator saves a byte per row vs the \r\n default
+        writer = csv.writer(output, lineterminator="\n", quoting=csv.QUOTE_MINIMAL)
 
         # Header
-        writer.writerow(
-            [
-                "keyword",
-                "timestamp",
-                "timestamp_seconds",
-                "snippet",
-                "confidence",
-                "match_type",
-            ]
-        )
+        writer.writerow(_CSV_HEADER)
 
-        # Data rows
-        for match in matches:
-            writer.writerow(
-                [
+        # Data rows in one C-level writerows call
+        writer.writerows(
+            [
+                (
                     match.get("keyword", ""),
                     match.get("timestamp", ""),
                     match.get("timestamp_seconds", 0),
-                    match.get("snippet", "").replace("...", "").strip(),
+                    _clean_snippet(match.get("snippet", "")),
                     match.get("confidence", 1.0),
                     match.get("match_type", "exact"),
-                ]
-            )
+                )
+                for match in matches
+            ]
+        )
 
         return output.getvalue()
 
@@ -237,56 +334,49 @@ class Exporter:
         Returns:
             Markdown formatted string
         """
-        lines = []
+        buf = io.StringIO()
+        w = buf.write
 
         # Header
-        lines.append("# Augent Search Results")
-        lines.append("")
+        w("# Augent Search Results\n\n")
 
         if audio_file:
-            lines.append(f"**Audio File:** {audio_file}")
-            lines.append("")
+            w(f"**Audio File:** {audio_file}\n\n")
+
+        # Group by keyword in one pass; the dict doubles as the deduplicated,
+        # first-seen-ordered keyword list for the summary
+        by_keyword: Dict[str, List[Dict]] = defaultdict(list)
+        for match in matches:
+            by_keyword[match.get("keyword", "unknown")].append(match)
 
         # Summary
-        keywords = list({m.get("keyword", "") for m in matches})
-        lines.append(f"**Keywords searched:** {', '.join(keywords)}")
-        lines.append(f"**Total matches:** {len(matches)}")
-        lines.append("")
+        w(f"**Keywords searched:** {', '.join(by_keyword)}\n")
+        w(f"**Total matches:** {len(matches)}\n\n")
 
         # Matches by keyword
-        lines.append("## Matches")
-        lines.append("")
-
-        # Group by keyword
-        by_keyword: Dict[str, List[Dict]] = {}
-        for match in matches:
-            kw = match.get("keyword", "unknown")
-            if kw not in by_keyword:
-                by_keyword[kw] = []
-            by_keyword[kw].append(match)
+        w("## Matches\n\n")
 
         for keyword, kw_matches in by_keyword.items():
-            lines.append(f"### {keyword} ({len(kw_matches)} matches)")
-            lines.append("")
-            lines.append("| Timestamp | Snippet | Type |")
-            lines.append("|-----------|---------|------|")
-
-            for match in kw_matches:
-                ts = match.get("timestamp", "")
-                snippet = match.get("snippet", "").replace("...", "").strip()
-                match_type = match.get("match_type", "exact")
-                lines.append(f"| {ts} | {snippet} | {match_type} |")
-
-            lines.append("")
+            # Build all rows for the group at once: two writes per group
+            # instead of one per row
+            rows = "\n".join(
+                f"| {m.get('timestamp', '')} "
+                f"| {_clean_snippet(m.get('snippet', ''))} "
+                f"| {m.get('match_type', 'exact')} |"
+                for m in kw_matches
+            )
+            w(
+                f"### {keyword} ({len(kw_matches)} matches)\n\n"
+                "| Timestamp | Snippet | Type |\n"
+                "|-----------|---------|------|\n"
+            )
+            w(f"{rows}\n\n")
 
         # Full transcription
         if include_full_text and transcription_text:
-            lines.append("## Full Transcription")
-            lines.append("")
-            lines.append(transcription_text)
-            lines.append("")
+            w(f"## Full Transcription\n\n{transcription_text}\n")
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     @staticmethod
     def to_json(
@@ -294,6 +384,8 @@ class Exporter:
         grouped: bool = True,
         include_metadata: bool = False,
         metadata: Optional[Dict] = None,
+        compact: bool = False,
+        project: bool = False,
     ) -> str:
         """
         Export matches to JSON format.
@@ -303,36 +395,57 @@ class Exporter:
             grouped: Group matches by keyword
             include_metadata: Include additional metadata
             metadata: Optional metadata dict
+            compact: Emit compact JSON (no indentation) for machine consumers
+            project: Copy each match down to the canonical five fields
+                instead of grouping by reference
 
         Returns:
             JSON formatted string
         """
         if grouped:
-            # Group by keyword
-            result: Dict[str, List[Dict]] = {}
-            for match in matches:
-                kw = match.get("keyword", "unknown")
-                if kw not in result:
-                    result[kw] = []
-                result[kw].append(
-                    {
-                        "timestamp": match.get("timestamp", ""),
-                        "timestamp_seconds": match.get("timestamp_seconds", 0),
-                        "snippet": match.get("snippet", ""),
-                        "confidence": match.get("confidence", 1.0),
-                        "match_type": match.get("match_type", "exact"),
-                    }
-                )
+            # Group by keyword; matches go in by reference unless the caller
+            # asks for the projected schema, avoiding a dict copy per match
+            result: Dict[str, List[Dict]] = defaultdict(list)
+            if project:
+                for match in matches:
+                    result[match.get("keyword", "unknown")].append(
+                        {
+                            "timestamp": match.get("timestamp", ""),
+                            "timestamp_seconds": match.get("timestamp_seconds", 0),
+                            "snippet": match.get("snippet", ""),
+                            "confidence": match.get("confidence", 1.0),
+                            "match_type": match.get("match_type", "exact"),
+                        }
+                    )
+            else:
+                for match in matches:
+                    result[match.get("keyword", "unknown")].append(match)
+
+            # Plain dict for the serializer (orjson rejects dict subclasses)
+            obj: object = dict(result)
+        else:
+            obj = matches
 
-            if include_metadata and metadata:
-                return json.dumps({"metadata": metadata, "matches": result}, indent=2)
+        if include_metadata and metadata:
+            obj = {"metadata": metadata, "matches": obj}
+
+        return _dumps(obj, indent=not compact)
 
-            return json.dumps(result, indent=2)
-        else:
-            if include_metadata and metadata:
-                return json.dumps({"metadata": metadata, "matches": matches}, indent=2)
 
-            return json.dumps(matches, indent=2)
+# Format dispatch tables: one dict lookup per call, no Exporter() allocation
+_MATCH_EXPORTERS = {
+    "json": Exporter.to_json,
+    "csv": Exporter.to_csv,
+    "srt": Exporter.matches_to_srt,
+    "vtt": Exporter.matches_to_vtt,
+    "markdown": Exporter.to_markdown,
+    "md": Exporter.to_markdown,
+}
+
+_TRANSCRIPTION_EXPORTERS = {
+    "srt": Exporter.to_srt,
+    "vtt": Exporter.to_vtt,
+}
 
 
 def export_matches(matches: List[Dict], format: str = "json", **kwargs) -> str:
@@ -348,22 +461,12 @@ def export_matches(matches: List[Dict], format: str = "json", **kwargs) -> str:
         Formatted string
     """
     format = format.lower()
-    exporter = Exporter()
-
-    if format == "json":
-        return exporter.to_json(matches, **kwargs)
-    elif format == "csv":
-        return exporter.to_csv(matches)
-    elif format == "srt":
-        return exporter.matches_to_srt(matches, **kwargs)
-    elif format == "vtt":
-        return exporter.matches_to_vtt(matches, **kwargs)
-    elif format in ("markdown", "md"):
-        return exporter.to_markdown(matches, **kwargs)
-    else:
+    exporter = _MATCH_EXPORTERS.get(format)
+    if exporter is None:
         raise ValueError(
             f"Unknown format: {format}. Use json, csv, srt, vtt, or markdown."
         )
+    return exporter(matches, **kwargs)
 
 
 def export_transcription(segments: List[Dict], format: str = "srt", **kwargs) -> str:
@@ -379,11 +482,7 @@ def export_transcription(segments: List[Dict], format: str = "srt", **kwargs) ->
         Formatted string
     """
     format = format.lower()
-    exporter = Exporter()
-
-    if format == "srt":
-        return exporter.to_srt(segments, **kwargs)
-    elif format == "vtt":
-        return exporter.to_vtt(segments, **kwargs)
-    else:
+    exporter = _TRANSCRIPTION_EXPORTERS.get(format)
+    if exporter is None:
         raise ValueError(f"Unknown format for transcription: {format}. Use srt or vtt.")
+    return exporter(segments, **kwargs)
@@ -44,28 +44,51 @@ Add to Claude Code project (.mcp.json):
 
 """
 
+import fnmatch
+import functools
+import importlib.util
 import json
 import os
+import re
 import shutil
 import signal
 import subprocess
 import sys
+import tempfile
+import threading
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
-# Check for required dependencies before importing
+# Probe for required dependencies without importing them — importing torch
+# takes seconds and would delay the MCP initialize handshake
 _MISSING_DEPS = []
-try:
-    import faster_whisper
-except ImportError:
+if importlib.util.find_spec("faster_whisper") is None:
     _MISSING_DEPS.append("faster-whisper")
-
-try:
-    import torch
-except ImportError:
+if importlib.util.find_spec("torch") is None:
     _MISSING_DEPS.append("torch")
 
+# Warm the heavy ML imports in the background so the first transcription
+# doesn't pay the import cost. Python's import lock makes any handler that
+# races this thread simply wait for the in-flight import to finish.
+_ml_imports_ready = threading.Event()
+
+
+def _import_ml_libs():
+    try:
+        import faster_whisper  # noqa: F401
+        import torch  # noqa: F401
+    except ImportError:
+        pass
+    _ml_imports_ready.set()
+
+
+if not _MISSING_DEPS:
+    threading.Thread(target=_import_ml_libs, daemon=True, name="ml-import").start()
+else:
+    _ml_imports_ready.set()
+
 if _MISSING_DEPS:
 
     def _dependency_error():
@@ -107,22 +130,78 @@ else:
         transcribe_audio,
     )
 
+# yt-dlp is called in-process (no subprocess startup per download)
+try:
+    from yt_dlp import YoutubeDL
+except ImportError:
+    YoutubeDL = None
+
+# orjson encodes dict-heavy JSON-RPC responses several times faster than
+# stdlib json; fall back silently when unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Optional dependencies (sentence-transformers, pyannote-audio, kokoro)
 # are imported lazily inside handler functions so that installing them
 # mid-session works without restarting the MCP server.
 
+# $HOME doesn't change within a server process — memoize tilde expansion
+# for the default directories resolved on every tool call. User-supplied
+# paths keep calling os.path.expanduser directly.
+_expanduser = functools.lru_cache(maxsize=64)(os.path.expanduser)
+
+
+@functools.lru_cache(maxsize=32)
+def _ensure_dir(path: str) -> None:
+    """makedirs once per unique directory — repeat calls skip the stat."""
+    os.makedirs(path, exist_ok=True)
+
+
+# Tool calls run on a small pool so cheap metadata tools (list_memories,
+# memory_stats) aren't stuck behind a long transcription. Model-bound tools
+# additionally serialize on _MODEL_SEM — one transcription at a time keeps
+# GPU memory bounded and avoids CPU thrash between Whisper instances.
+_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="tool")
+_MODEL_SEM = threading.BoundedSemaphore(1)
+_SEND_LOCK = threading.Lock()
+
 
 def send_response(response: dict) -> None:
     """Send JSON-RPC response to stdout."""
-    output = json.dumps(response)
-    sys.stdout.write(output + "\n")
-    sys.stdout.flush()
+    # Single writer: pool threads must not interleave partial lines
+    with _SEND_LOCK:
+        buffer = getattr(sys.stdout, "buffer", None)
+        if orjson is not None and buffer is not None:
+            # orjson emits bytes — write them directly, skipping text-mode re-encoding
+            buffer.write(orjson.dumps(response) + b"\n")
+            buffer.flush()
+        else:
+            sys.stdout.write(json.dumps(response) + "\n")
+            sys.stdout.flush()
+
+
+def send_raw_response(frame: str) -> None:
+    """Write one pre-serialized JSON-RPC frame to stdout."""
+    with _SEND_LOCK:
+        buffer = getattr(sys.stdout, "buffer", None)
+        if buffer is not None:
+            buffer.write(frame.encode("utf-8") + b"\n")
+            buffer.flush()
+        else:
+            sys.stdout.write(frame + "\n")
+            sys.stdout.flush()
+
+
+def send_notification(method: str, params: dict) -> None:
+    """Send a JSON-RPC notification (no id, no response expected)."""
+    send_response({"jsonrpc": "2.0", "method": method, "params": params})
 
 
 def _strip_quarantine(path: str) -> None:
     """Remove macOS quarantine flag from a file."""
     import platform
-    import subprocess
 
     if platform.system() == "Darwin":
         try:
@@ -133,12 +212,10 @@ def _strip_quarantine(path: str) -> None:
             pass
 
 
-import re as _re
-
 # Track source URLs for downloaded files so transcription can attach them
 _downloaded_urls: dict = {}  # file_path -> source_url
 
-_YOUTUBE_VIDEO_ID_RE = _re.compile(
+_YOUTUBE_VIDEO_ID_RE = re.compile(
     r"(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/|youtube\.com/shorts/)"
     r"([a-zA-Z0-9_-]{11})"
 )
@@ -179,8 +256,6 @@ def _write_output_file(
     Returns:
         Absolute path of written file
     """
-    import os
-    import re
 
     path = os.path.expanduser(output_path)
     os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
@@ -199,7 +274,6 @@ def _write_csv(path: str, rows: list, columns: list) -> None:
     """Write plain CSV file."""
     import csv
     import io
-    import re
 
     bold_pattern = re.compile(r"\*\*(.+?)\*\*")
 
@@ -248,8 +322,6 @@ def _write_xlsx(
         _write_csv(path.replace(".xlsx", ".csv"), rows, columns)
         return
 
-    import re
-
     bold_pattern = re.compile(r"\*\*(.+?)\*\*")
 
     wb = Workbook()
@@ -318,26 +390,34 @@ def _write_xlsx(
     wb.save(path)
 
 
+# Error frames have a fixed shape — fill the template instead of building
+# and serializing a nested dict per error
+_ERROR_FRAME = '{"jsonrpc":"2.0","id":%s,"error":{"code":%d,"message":%s}}'
+
+
 def send_error(id: Any, code: int, message: str) -> None:
     """Send JSON-RPC error response."""
-    send_response(
-        {"jsonrpc": "2.0", "id": id, "error": {"code": code, "message": message}}
-    )
+    send_raw_response(_ERROR_FRAME % (json.dumps(id), code, json.dumps(message)))
+
+
+# Success frames share one shape; handlers with constant results fill it
+# with a pre-serialized payload
+_RESULT_FRAME = '{"jsonrpc":"2.0","id":%s,"result":%s}'
+
+# The initialize result never varies — serialize it once at import
+_INITIALIZE_RESULT = json.dumps(
+    {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {"tools": {}},
+        "serverInfo": {"name": "augent", "version": "2026.4.1"},
+    },
+    separators=(",", ":"),
+)
 
 
 def handle_initialize(id: Any, params: dict) -> None:
     """Handle initialize request."""
-    send_response(
-        {
-            "jsonrpc": "2.0",
-            "id": id,
-            "result": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {"tools": {}},
-                "serverInfo": {"name": "augent", "version": "2026.4.1"},
-            },
-        }
-    )
+    send_raw_response(_RESULT_FRAME % (json.dumps(id), _INITIALIZE_RESULT))
 
 
 _ALL_TOOLS = [
@@ -380,6 +460,21 @@ _ALL_TOOLS = [
                     ],
                     "description": "Whisper model size. ALWAYS use tiny unless the user explicitly requests a different size. tiny is already highly accurate.",
                 },
+                "compute_type": {
+                    "type": "string",
+                    "enum": [
+                        "auto",
+                        "int8",
+                        "int8_float16",
+                        "float16",
+                        "float32",
+                    ],
+                    "description": "Whisper compute precision. Default auto resolves to int8 on CPU and int8_float16 on CUDA for speed.",
+                },
+                "vad_filter": {
+                    "type": "boolean",
+                    "description": "Skip silent regions with voice activity detection before transcribing. Faster on audio with long pauses. Default: true",
+                },
                 "start": {
                     "type": "number",
                     "description": "Start transcription at this many seconds into the audio. Default: 0 (beginning)",
@@ -426,6 +521,17 @@ _ALL_TOOLS = [
                     ],
                     "description": "Whisper model size. ALWAYS use tiny unless the user explicitly requests a different size. tiny is already highly accurate.",
                 },
+                "compute_type": {
+                    "type": "string",
+                    "enum": [
+                        "auto",
+                        "int8",
+                        "int8_float16",
+                        "float16",
+                        "float32",
+                    ],
+                    "description": "Whisper compute precision. Default auto resolves to int8 on CPU and int8_float16 on CUDA for speed.",
+                },
                 "include_full_text": {
                     "type": "boolean",
                     "description": "Include full transcription text in response. Default: false",
@@ -606,6 +712,17 @@ _ALL_TOOLS = [
                     ],
                     "description": "Whisper model size. ALWAYS use tiny unless the user explicitly requests a different size. tiny is already highly accurate.",
                 },
+                "compute_type": {
+                    "type": "string",
+                    "enum": [
+                        "auto",
+                        "int8",
+                        "int8_float16",
+                        "float16",
+                        "float32",
+                    ],
+                    "description": "Whisper compute precision. Default auto resolves to int8 on CPU and int8_float16 on CUDA for speed.",
+                },
                 "workers": {
                     "type": "integer",
                     "description": "Number of parallel workers. Default: 2",
@@ -684,6 +801,17 @@ _ALL_TOOLS = [
                     ],
                     "description": "Whisper model size. ALWAYS use tiny unless the user explicitly requests a different size. tiny is already highly accurate.",
                 },
+                "compute_type": {
+                    "type": "string",
+                    "enum": [
+                        "auto",
+                        "int8",
+                        "int8_float16",
+                        "float16",
+                        "float32",
+                    ],
+                    "description": "Whisper compute precision. Default auto resolves to int8 on CPU and int8_float16 on CUDA for speed.",
+                },
                 "output": {
                     "type": "string",
                     "description": "Optional file path to save results. Use .csv for plain data or .xlsx for styled spreadsheets with bold headers and formatting.",
@@ -1015,19 +1143,80 @@ _ALL_TOOLS = [
 _active_recordings: dict = {}
 
 
+# Required arguments per tool, precomputed from the schemas so missing
+# fields are rejected before dispatch instead of deep inside a handler
+_REQUIRED_ARGS = {
+    t["name"]: tuple(t["inputSchema"].get("required") or ()) for t in _ALL_TOOLS
+}
+
+# tools/list result cache — the schema is constant data, so build the
+# filtered list once per disabled_tools set instead of on every request
+_tools_list_cache: dict = {}
+
+# Optional dependency behind each gated tool. Probed with find_spec (no
+# import, no torch load) on every tools/list so a mid-session pip install
+# makes the tool appear without restarting the server.
+# Tools that load a Whisper/embedding/diarization model in-process —
+# serialized on _MODEL_SEM so concurrent calls can't stack model
+# instances in memory. text_to_speech is deliberately absent: its
+# handler only spawns the worker subprocess (Kokoro loads in the child)
+# and must stay immediate for job starts and status polls
+_MODEL_BOUND_TOOLS = frozenset(
+    {
+        "transcribe_audio",
+        "search_audio",
+        "deep_search",
+        "take_notes",
+        "chapters",
+        "batch_search",
+        "search_proximity",
+        "identify_speakers",
+        "separate_audio",
+        "highlights",
+    }
+)
+
+# Cap on the text/full_text fields in tool results (chars). Past this the
+# payload is almost certainly a multi-hour transcript the client will not
+# consume whole — segments still carry the complete content.
+_MAX_TEXT_CHARS = 200_000
+
+_OPTIONAL_TOOL_DEPS = {
+    "deep_search": "sentence_transformers",
+    "chapters": "sentence_transformers",
+    "highlights": "sentence_transformers",
+    "identify_speakers": "pyannote",
+    "text_to_speech": "kokoro",
+    "separate_audio": "demucs",
+}
+
+
+def _unavailable_tools() -> frozenset:
+    """Tools whose optional dependency is not installed."""
+    return frozenset(
+        tool
+        for tool, module in _OPTIONAL_TOOL_DEPS.items()
+        if importlib.util.find_spec(module) is None
+    )
+
+
 def handle_tools_list(id: Any) -> None:
-    """Handle tools/list request — filters out disabled tools from config."""
+    """Handle tools/list request — filters out disabled and unavailable tools."""
     from .config import get_config
 
-    disabled = set(get_config().get("disabled_tools", []))
-    tools = [t for t in _ALL_TOOLS if t["name"] not in disabled]
-    send_response(
-        {
-            "jsonrpc": "2.0",
-            "id": id,
-            "result": {"tools": tools},
-        }
-    )
+    disabled = frozenset(get_config().get("disabled_tools", []))
+    hidden = disabled | _unavailable_tools()
+    payload = _tools_list_cache.get(hidden)
+    if payload is None:
+        # Serialize once per hidden-set: the ~30KB schema dump is by far
+        # the largest constant response the server sends
+        tools = [t for t in _ALL_TOOLS if t["name"] not in hidden]
+        if orjson is not None:
+            payload = orjson.dumps({"tools": tools}).decode()
+        else:
+            payload = json.dumps({"tools": tools}, separators=(",", ":"))
+        _tools_list_cache[hidden] = payload
+    send_raw_response(_RESULT_FRAME % (json.dumps(id), payload))
 
 
 def handle_tools_call(id: Any, params: dict) -> None:
@@ -1037,67 +1226,59 @@ def handle_tools_call(id: Any, params: dict) -> None:
     tool_name = params.get("name")
     arguments = params.get("arguments", {})
 
+    # Progress notifications must echo the caller's token (MCP spec);
+    # handlers that stream progress read it from this reserved key
+    meta = params.get("_meta") or {}
+    if "progressToken" in meta:
+        arguments = {**arguments, "_progress_token": meta["progressToken"]}
+
     disabled = set(get_config().get("disabled_tools", []))
     if tool_name in disabled:
         send_error(id, -32602, f"Tool is disabled: {tool_name}")
         return
 
+    handler = _TOOL_HANDLERS.get(tool_name)
+    if handler is None:
+        send_error(id, -32602, f"Unknown tool: {tool_name}")
+        return
+
+    # Presence check only — falsy-but-present values (e.g. start: 0) are
+    # left to the handlers' own validation
+    for arg in _REQUIRED_ARGS.get(tool_name, ()):
+        if arguments.get(arg) is None:
+            send_error(id, -32602, f"Missing required parameter: {arg}")
+            return
+
     try:
-        if tool_name == "download_audio":
-            result = handle_download_audio(arguments)
-        elif tool_name == "transcribe_audio":
-            result = handle_transcribe_audio(arguments)
-        elif tool_name == "search_audio":
-            result = handle_search_audio(arguments)
-        elif tool_name == "deep_search":
-            result = handle_deep_search(arguments)
-        elif tool_name == "take_notes":
-            result = handle_take_notes(arguments)
-        elif tool_name == "chapters":
-            result = handle_chapters(arguments)
-        elif tool_name == "batch_search":
-            result = handle_batch_search(arguments)
-        elif tool_name == "text_to_speech":
-            result = handle_text_to_speech(arguments)
-        elif tool_name == "search_proximity":
-            result = handle_search_proximity(arguments)
-        elif tool_name == "identify_speakers":
-            result = handle_identify_speakers(arguments)
-        elif tool_name == "list_files":
-            result = handle_list_files(arguments)
-        elif tool_name == "list_memories":
-            result = handle_list_memories(arguments)
-        elif tool_name == "memory_stats":
-            result = handle_memory_stats(arguments)
-        elif tool_name == "clear_memory":
-            result = handle_clear_memory(arguments)
-        elif tool_name == "search_memory":
-            result = handle_search_memory(arguments)
-        elif tool_name == "separate_audio":
-            result = handle_separate_audio(arguments)
-        elif tool_name == "clip_export":
-            result = handle_clip_export(arguments)
-        elif tool_name == "highlights":
-            result = handle_highlights(arguments)
-        elif tool_name == "tag":
-            result = handle_tag(arguments)
-        elif tool_name == "rebuild_graph":
-            result = handle_rebuild_graph(arguments)
-        elif tool_name == "visual":
-            result = handle_visual(arguments)
-        elif tool_name == "spaces":
-            result = handle_spaces(arguments)
+        if tool_name in _MODEL_BOUND_TOOLS:
+            with _MODEL_SEM:
+                result = handler(arguments)
         else:
-            send_error(id, -32602, f"Unknown tool: {tool_name}")
-            return
+            result = handler(arguments)
+
+        # Multi-hour transcripts can exceed a megabyte and get
+        # double-encoded into the content string — cap the text fields
+        if isinstance(result, dict):
+            for key in ("text", "full_text"):
+                val = result.get(key)
+                if isinstance(val, str) and len(val) > _MAX_TEXT_CHARS:
+                    result[key] = (
+                        val[:_MAX_TEXT_CHARS]
+                        + f"...[truncated {len(val) - _MAX_TEXT_CHARS} chars]"
+                    )
+
+        # Compact encoding — pretty-printing bloats transcription-sized
+        # results by ~30% and the client parses the JSON anyway
+        if orjson is not None:
+            text = orjson.dumps(result).decode()
+        else:
+            text = json.dumps(result, separators=(",", ":"))
 
         send_response(
             {
                 "jsonrpc": "2.0",
                 "id": id,
-                "result": {
-                    "content": [{"type": "text", "text": json.dumps(result, indent=2)}]
-                },
+                "result": {"content": [{"type": "text", "text": text}]},
             }
         )
 
@@ -1109,67 +1290,99 @@ def handle_tools_call(id: Any, params: dict) -> None:
         send_error(id, -32603, f"Error: {str(e)}")
 
 
+# Reused YoutubeDL instances keyed by options — keeps yt-dlp's HTTP
+# connection pool and extractor caches warm across download calls, so
+# repeat downloads skip TCP/TLS handshakes to the same CDN edges.
+# YoutubeDL is stateful (progress state, retcode, extractor caches) and
+# not thread-safe, so each cached instance carries a lock; a call that
+# finds it mid-download gets a fresh throwaway instance instead
+_ydl_cache: dict = {}  # (output_dir, has_aria2c) -> (YoutubeDL, Lock)
+_ydl_cache_lock = threading.Lock()
+
+
+def _build_ydl_opts(output_dir: str, has_aria2c: bool) -> dict:
+    """Build the yt-dlp option dict for the given target."""
+    # bestaudio/best fallback handles YouTube SABR streaming
+    ydl_opts = {
+        "format": "bestaudio/best",
+        # Scale fragment parallelism with the machine, capped where
+        # CDN edges stop rewarding extra connections
+        "concurrent_fragment_downloads": min(16, max(4, os.cpu_count() or 4)),
+        "http_chunk_size": 10 << 20,
+        "noplaylist": True,
+        "restrictfilenames": True,
+        "outtmpl": f"{output_dir}/%(title)s [%(id)s].%(ext)s",
+        "quiet": True,
+        "no_warnings": True,
+    }
+    if has_aria2c:
+        ydl_opts["external_downloader"] = {"default": "aria2c"}
+        ydl_opts["external_downloader_args"] = {
+            # -x: connections per server, -s: splits, -k: min split size
+            "aria2c": ["-x", "16", "-s", "16", "-k", "1M", "--file-allocation=none"]
+        }
+    return ydl_opts
+
+
+def _get_ydl(output_dir: str, has_aria2c: bool):
+    """Get a (YoutubeDL, release) pair; call release() after the download.
+
+    Returns the cached instance when it is idle. When another pool worker
+    is mid-download on it, returns a fresh uncached instance so state is
+    never shared across concurrent calls.
+    """
+    key = (output_dir, has_aria2c)
+    with _ydl_cache_lock:
+        entry = _ydl_cache.get(key)
+        if entry is None:
+            entry = (
+                YoutubeDL(_build_ydl_opts(output_dir, has_aria2c)),
+                threading.Lock(),
+            )
+            _ydl_cache[key] = entry
+    ydl, lock = entry
+    if lock.acquire(blocking=False):
+        return ydl, lock.release
+    return YoutubeDL(_build_ydl_opts(output_dir, has_aria2c)), lambda: None
+
+
 def handle_download_audio(arguments: dict) -> dict:
     """Handle download_audio tool call."""
-    import os
-    import re
-    import shutil
-    import subprocess
 
     from .config import get_config
 
     cfg = get_config()
     url = arguments.get("url")
-    output_dir = arguments.get("output_dir", os.path.expanduser(cfg["output_dir"]))
+    output_dir = arguments.get("output_dir", _expanduser(cfg["output_dir"]))
 
     if not url:
         raise ValueError("Missing required parameter: url")
 
-    # Ensure output directory exists
-    os.makedirs(output_dir, exist_ok=True)
+    if YoutubeDL is None:
+        raise RuntimeError("yt-dlp not found. Install with: pip install yt-dlp")
 
-    # Find yt-dlp — prefer brew (stays current) over pip
-    ytdlp = shutil.which(
-        "yt-dlp", path="/opt/homebrew/bin:/usr/local/bin"
-    ) or shutil.which("yt-dlp")
-    if not ytdlp:
-        raise RuntimeError("yt-dlp not found. Install with: brew install yt-dlp")
+    # Ensure output directory exists
+    _ensure_dir(output_dir)
 
     # Check for aria2c (optional but recommended)
     has_aria2c = shutil.which("aria2c") is not None
 
-    # Build command — bestaudio/best fallback handles YouTube SABR streaming
-    cmd = [
-        ytdlp,
-        "-f",
-        "bestaudio/best",
-        "--concurrent-fragments",
-        "4",
-        "--no-playlist",
-        "--restrict-filenames",
-        "-o",
-        f"{output_dir}/%(title)s [%(id)s].%(ext)s",
-        "--print",
-        "after_move:filepath",  # Print the final file path
-    ]
-
-    if has_aria2c:
-        cmd.extend(
-            ["--downloader", "aria2c", "--downloader-args", "aria2c:-x 16 -s 16 -k 1M"]
-        )
-
-    cmd.append(url)
-
-    # Run download
-    result = subprocess.run(cmd, capture_output=True, text=True)
-
-    if result.returncode != 0:
-        error_msg = result.stderr.strip() or "Download failed"
-        raise RuntimeError(f"Download failed: {error_msg}")
-
-    # Extract the output file path from stdout
-    output_lines = result.stdout.strip().split("\n")
-    output_file = output_lines[-1] if output_lines else None
+    # Run download in-process — no yt-dlp interpreter startup per call
+    ydl, release = _get_ydl(output_dir, has_aria2c)
+    try:
+        info = ydl.extract_info(url, download=True)
+        output_file = None
+        if info:
+            # requested_downloads carries the final path after merging
+            downloads = info.get("requested_downloads") or []
+            if downloads and downloads[0].get("filepath"):
+                output_file = downloads[0]["filepath"]
+            else:
+                output_file = ydl.prepare_filename(info)
+    except Exception as e:
+        raise RuntimeError(f"Download failed: {e}") from e
+    finally:
+        release()
 
     # Get file info if available
     file_info = {}
@@ -1178,7 +1391,7 @@ def handle_download_audio(arguments: dict) -> dict:
         file_info = {
             "path": output_file,
             "filename": os.path.basename(output_file),
-            "size_mb": round(file_size / (1024 * 1024), 2),
+            "size_mb": (file_size * 100 + (1 << 19)) // (1 << 20) / 100.0,
         }
 
     # Register source URL so transcription can attach it to memory
@@ -1214,6 +1427,7 @@ def handle_search_audio(arguments: dict) -> dict:
     audio_path = arguments.get("audio_path")
     keywords = arguments.get("keywords", [])
     model_size = arguments.get("model_size", cfg["model_size"])
+    compute_type = arguments.get("compute_type", "auto")
     include_full = arguments.get("include_full_text", False)
     output = arguments.get("output")
     clip = arguments.get("clip", False)
@@ -1225,9 +1439,13 @@ def handle_search_audio(arguments: dict) -> dict:
         raise ValueError("Missing required parameter: keywords")
 
     if include_full:
-        result = search_audio_full(audio_path, keywords, model_size=model_size)
+        result = search_audio_full(
+            audio_path, keywords, model_size=model_size, compute_type=compute_type
+        )
     else:
-        result = search_audio(audio_path, keywords, model_size=model_size)
+        result = search_audio(
+            audio_path, keywords, model_size=model_size, compute_type=compute_type
+        )
 
     result["model_used"] = model_size
 
@@ -1305,14 +1523,14 @@ def handle_search_audio(arguments: dict) -> dict:
 
 def handle_transcribe_audio(arguments: dict) -> dict:
     """Handle transcribe_audio tool call."""
-    import subprocess
-    import tempfile
 
     from .config import get_config
 
     cfg = get_config()
     audio_path = arguments.get("audio_path")
     model_size = arguments.get("model_size", cfg["model_size"])
+    compute_type = arguments.get("compute_type", "auto")
+    vad_filter = arguments.get("vad_filter", True)
     start = arguments.get("start")
     duration = arguments.get("duration")
     output = arguments.get("output")
@@ -1358,7 +1576,9 @@ def handle_transcribe_audio(arguments: dict) -> dict:
     original_audio_path = arguments.get("audio_path")
 
     try:
-        result = transcribe_audio(audio_path, model_size)
+        result = transcribe_audio(
+            audio_path, model_size, compute_type=compute_type, vad_filter=vad_filter
+        )
     finally:
         # Clean up temp file
         if trimmed_path and os.path.exists(trimmed_path):
@@ -1507,6 +1727,7 @@ def handle_search_proximity(arguments: dict) -> dict:
     keyword2 = arguments.get("keyword2")
     max_distance = arguments.get("max_distance", 30)
     model_size = arguments.get("model_size", cfg["model_size"])
+    compute_type = arguments.get("compute_type", "auto")
     output = arguments.get("output")
 
     if not audio_path:
@@ -1517,7 +1738,12 @@ def handle_search_proximity(arguments: dict) -> dict:
         raise ValueError("Missing required parameter: keyword2")
 
     matches = search_audio_proximity(
-        audio_path, keyword1, keyword2, max_distance=max_distance, model_size=model_size
+        audio_path,
+        keyword1,
+        keyword2,
+        max_distance=max_distance,
+        model_size=model_size,
+        compute_type=compute_type,
     )
 
     # Add YouTube links if source is YouTube
@@ -1561,8 +1787,6 @@ def handle_search_proximity(arguments: dict) -> dict:
 
 def handle_batch_search(arguments: dict) -> dict:
     """Handle batch_search tool call."""
-    import os
-    from concurrent.futures import ThreadPoolExecutor, as_completed
 
     from .config import get_config
 
@@ -1570,42 +1794,67 @@ def handle_batch_search(arguments: dict) -> dict:
     audio_paths = arguments.get("audio_paths", [])
     keywords = arguments.get("keywords", [])
     model_size = arguments.get("model_size", cfg["model_size"])
-    workers = arguments.get("workers", 2)
+    compute_type = arguments.get("compute_type", "auto")
+    progress_token = arguments.get("_progress_token")
 
     if not audio_paths:
         raise ValueError("Missing required parameter: audio_paths")
     if not keywords:
         raise ValueError("Missing required parameter: keywords")
 
-    # Validate all paths exist
-    valid_paths = []
+    # Validate with a single stat per path, keeping the size for ordering
+    stats = []
     errors = []
     for path in audio_paths:
-        if os.path.exists(path):
-            valid_paths.append(path)
-        else:
+        try:
+            size = os.stat(path).st_size
+        except OSError:
             errors.append({"path": path, "error": "File not found"})
+            continue
+        stats.append((path, size))
 
-    results = {}
+    # Largest files first — the longest transcription starts earliest, so
+    # progress notifications front-load the slow work and any future
+    # worker overlap keeps the batch tail short (LPT scheduling)
+    stats.sort(key=lambda t: -t[1])
+    valid_paths = [p for p, _ in stats]
 
-    def process_file(path):
-        try:
-            return path, search_audio(path, keywords, model_size=model_size)
-        except Exception as e:
-            return path, {"error": str(e)}
+    # Load the shared model once so every file below is a cache hit
+    if valid_paths and not _MISSING_DEPS:
+        from .memory import get_model_cache
 
-    with ThreadPoolExecutor(max_workers=workers) as executor:
-        futures = {executor.submit(process_file, p): p for p in valid_paths}
-        for future in as_completed(futures):
-            path, result = future.result()
-            results[path] = result
+        get_model_cache().get(model_size, compute_type=compute_type)
 
-    # Aggregate stats
+    # Transcription is model-bound, so process files sequentially against the
+    # shared model — Python threads only added GIL contention around the
+    # post-processing and interleaved access to one compute device.
+    # The workers argument is accepted for backward compatibility.
+    results = {}
+    total = len(valid_paths)
     total_matches = 0
-    for _path, file_results in results.items():
-        if "error" not in file_results:
-            for _kw, matches in file_results.items():
-                total_matches += len(matches)
+    for i, path in enumerate(valid_paths, 1):
+        try:
+            file_results = search_audio(
+                path, keywords, model_size=model_size, compute_type=compute_type
+            )
+            # Aggregate while the per-file dict is at hand instead of
+            # re-walking every result after the loop
+            total_matches += sum(len(m) for m in file_results.values())
+        except Exception as e:
+            file_results = {"error": str(e)}
+        results[path] = file_results
+        # Stream per-file progress so clients see results before the batch
+        # ends — only when the caller supplied a token to associate it with
+        if progress_token is not None:
+            send_notification(
+                "notifications/progress",
+                {
+                    "progressToken": progress_token,
+                    "progress": i,
+                    "total": total,
+                    "path": path,
+                },
+            )
 
     return {
         "files_processed": len(valid_paths),
@@ -1617,22 +1866,15 @@ def handle_batch_search(arguments: dict) -> dict:
     }
 
 
+# Media extensions matched by list_files when no pattern is given —
+# O(1) set membership instead of one glob pass per extension
+_MEDIA_EXTS = frozenset(
+    {".mp3", ".m4a", ".wav", ".webm", ".mp4", ".mkv", ".ogg", ".flac"}
+)
+
+
 def handle_list_files(arguments: dict) -> dict:
     """Handle list_files tool call."""
-    import glob as glob_module
-    import os
-
-    DEFAULT_PATTERNS = [
-        "*.mp3",
-        "*.m4a",
-        "*.wav",
-        "*.webm",
-        "*.mp4",
-        "*.mkv",
-        "*.ogg",
-        "*.flac",
-    ]
-
     directory = arguments.get("directory")
     pattern = arguments.get("pattern")
     recursive = arguments.get("recursive", False)
@@ -1643,38 +1885,70 @@ def handle_list_files(arguments: dict) -> dict:
     if not os.path.isdir(directory):
         raise ValueError(f"Directory not found: {directory}")
 
-    # Build search pattern(s)
-    files = []
+    # Simple "*.ext" patterns get a suffix check; anything else compiles to
+    # a regex once instead of being re-translated per entry
+    pattern_re = None
+    simple_ext = None
     if pattern:
-        patterns = [pattern]
-    else:
-        patterns = DEFAULT_PATTERNS
-
-    for p in patterns:
-        if recursive:
-            search_pattern = os.path.join(directory, "**", p)
-            files.extend(glob_module.glob(search_pattern, recursive=True))
+        tail = pattern[2:]
+        if pattern.startswith("*.") and not any(c in tail for c in "*?["):
+            simple_ext = pattern[1:].lower()
         else:
-            search_pattern = os.path.join(directory, p)
-            files.extend(glob_module.glob(search_pattern))
+            # IGNORECASE keeps both branches on the same policy as the
+            # extension checks (media files commonly ship as .MP3/.WAV)
+            pattern_re = re.compile(fnmatch.translate(pattern), re.IGNORECASE)
 
-    # Deduplicate and sort
-    files = sorted(set(files))
-
-    # Get file info
+    # Single scandir pass per directory: entry type and size come from the
+    # same syscall batch, and extension membership replaces per-pattern
+    # globbing that reopened the directory for every pattern
     audio_files = []
-    for f in files:
+    stack = [directory]
+    while stack:
         try:
-            size = os.path.getsize(f)
-            audio_files.append(
-                {
-                    "path": f,
-                    "name": os.path.basename(f),
-                    "size_mb": round(size / (1024 * 1024), 2),
-                }
-            )
+            entries = os.scandir(stack.pop())
         except OSError:
-            pass
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        # Prune hidden dirs (.git, .cache, ...) at the walk
+                        # level instead of descending and filtering later
+                        if recursive and not entry.name.startswith("."):
+                            stack.append(entry.path)
+                        continue
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    # Hidden files skipped in every branch, matching the
+                    # hidden-directory pruning above
+                    if entry.name.startswith("."):
+                        continue
+                    if simple_ext is not None:
+                        if not entry.name.lower().endswith(simple_ext):
+                            continue
+                    elif pattern_re is not None:
+                        if pattern_re.match(entry.name) is None:
+                            continue
+                    else:
+                        # rfind+slice beats splitext here: no tuple, no
+                        # normpath logic, and entry.name is already a basename
+                        dot = entry.name.rfind(".")
+                        if dot < 0 or entry.name[dot:].lower() not in _MEDIA_EXTS:
+                            continue
+                    # DirEntry caches the stat result — no second syscall
+                    size = entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
+                audio_files.append(
+                    {
+                        "path": entry.path,
+                        "name": entry.name,
+                        # Integer round-half-up to 2dp — no float divide per file
+                        "size_mb": (size * 100 + (1 << 19)) // (1 << 20) / 100.0,
+                    }
+                )
+
+    audio_files.sort(key=lambda f: f["path"])
 
     return {
         "directory": directory,
@@ -1685,20 +1959,38 @@ def handle_list_files(arguments: dict) -> dict:
     }
 
 
+# Agents tend to poll list_memories/memory_stats repeatedly in one session;
+# a short TTL avoids hitting SQLite on every call while bounding staleness.
+_MEM_CACHE: dict = {}
+_MEM_CACHE_TTL = 2.0
+
+
+def _mem_cached(key: str, compute):
+    """Return compute() memoized under key for _MEM_CACHE_TTL seconds."""
+    now = time.time()
+    hit = _MEM_CACHE.get(key)
+    if hit is not None and now - hit[0] < _MEM_CACHE_TTL:
+        return hit[1]
+    value = compute()
+    _MEM_CACHE[key] = (now, value)
+    return value
+
+
 def handle_memory_stats(arguments: dict) -> dict:
     """Handle memory_stats tool call."""
-    return get_memory_stats()
+    return _mem_cached("stats", get_memory_stats)
 
 
 def handle_clear_memory(arguments: dict) -> dict:
     """Handle clear_memory tool call."""
     count = clear_memory()
+    _MEM_CACHE.clear()
     return {"cleared": count, "message": f"Cleared {count} stored transcription(s)"}
 
 
 def handle_list_memories(arguments: dict) -> dict:
     """Handle list_memories tool call."""
-    entries = list_memories()
+    entries = _mem_cached("list", list_memories)
     return {
         "count": len(entries),
         "transcriptions": entries,
@@ -1706,6 +1998,127 @@ def handle_list_memories(arguments: dict) -> dict:
     }
 
 
+@functools.cache
+def _obsidian_installed() -> bool:
+    """Whether Obsidian is installed — checked once per process.
+
+    shutil.which walks the whole PATH, so don't redo it per take_notes call.
+    """
+    return os.path.exists("/Applications/Obsidian.app") or bool(
+        shutil.which("obsidian")
+    )
+
+
+_STYLES = {
+    "tldr": (
+        "Create the shortest possible summary. Must fit on one screen.\n"
+        "\n"
+        "FORMAT:\n"
+        "- Title as a top header\n"
+        "- Do NOT include source URL, duration, or date — frontmatter handles metadata\n"
+        "- ---\n"
+        "- One 2-3 sentence overview paragraph\n"
+        "- 5-8 bullet points max, each one line\n"
+        "- **Bold** the single most important term or name in each bullet\n"
+        "- No sections, no headers, no callouts, no quotes — just clean bullets\n"
+        "- End with one bold takeaway line\n"
+    ),
+    "notes": (
+        "Create clean, structured notes with clear hierarchy.\n"
+        "\n"
+        "FORMAT:\n"
+        "- Title as a top header\n"
+        "- Do NOT include source URL, duration, or date — frontmatter handles metadata\n"
+        "- ---\n"
+        "- 3-6 section headers based on the main topics\n"
+        "- Nested bullet points under each section (2 levels max)\n"
+        "- **Bold** key terms and names throughout\n"
+        "- Short paragraphs only — never more than 3 lines\n"
+        "- One > blockquote if there's a standout quote worth preserving\n"
+        "- Keep it scannable — someone should grasp the content in 60 seconds\n"
+    ),
+    "highlight": (
+        "Create formatted notes with visual emphasis on key insights.\n"
+        "\n"
+        "FORMAT:\n"
+        "- Title as a top header\n"
+        "- Do NOT include source URL, duration, or date — frontmatter handles metadata\n"
+        "- ---\n"
+        "- Section headers for each major topic\n"
+        "- Nested bullet points with **bold key terms**\n"
+        "- Use > [!tip] callout blocks for the 2-4 most important insights\n"
+        "- Use > [!info] callout blocks for definitions or context\n"
+        "- Use > blockquotes with timestamps for 2-3 key direct quotes\n"
+        "- Use **bold** and *italic* generously for emphasis\n"
+        "- Add a --- separator between major sections\n"
+        "- End with a Key Takeaways section using a > [!summary] callout\n"
+    ),
+    "eye-candy": (
+        "Create the most visually rich, beautifully formatted notes possible. "
+        "Every section should be a visual experience — the reader should absorb "
+        "the content by scanning, not reading.\n"
+        "\n"
+        "FORMAT:\n"
+        "- Title as a top header\n"
+        "- Do NOT include source URL, duration, or date — frontmatter handles metadata\n"
+        "- ---\n"
+        "- Section headers for every topic shift\n"
+        "- Nested bullet points (up to 3 levels) with **bold** and *italic*\n"
+        "- > [!tip] callout blocks for key insights (use liberally, 4-6 throughout)\n"
+        "- > [!info] callout blocks for context, background, definitions\n"
+        "- > [!warning] callout blocks for common mistakes or misconceptions\n"
+        "- > [!example] callout blocks for concrete examples mentioned\n"
+        "- > blockquotes with timestamps for 3-5 standout direct quotes\n"
+        "- Tables anywhere a comparison or list of items is discussed\n"
+        "- --- separators between major sections\n"
+        "- Checklists (- [ ]) for any action items or recommendations\n"
+        "- End with:\n"
+        "  1. A > [!summary] Key Takeaways callout with numbered list\n"
+        "  2. A table of Related Topics / Further Reading if applicable\n"
+        "\n"
+        "The goal: someone opens this file in Obsidian and says 'wow'.\n"
+    ),
+    "quiz": (
+        "Generate a multiple-choice quiz from the content. Do NOT write notes.\n"
+        "\n"
+        "FORMAT:\n"
+        "- Title as a top header with 'Quiz' appended\n"
+        "- Do NOT include source URL, duration, or date — frontmatter handles metadata\n"
+        "- ---\n"
+        "- 10-15 multiple-choice questions\n"
+        "- Each question MUST follow this EXACT structure:\n"
+        "\n"
+        "### 1. **Question text here?**\n"
+        "\n"
+        "A) First option\n"
+        "B) Second option\n"
+        "C) Third option\n"
+        "D) Fourth option\n"
+        "\n"
+        "- ---\n"
+        "- Answer Key section at the bottom with this EXACT format:\n"
+        "\n"
+        "## Answer Key\n"
+        "\n"
+        "**1. B** — Explanation of why B is correct.\n"
+        "**2. A** — Explanation of why A is correct.\n"
+        "**3. D** — Explanation of why D is correct.\n"
+        "\n"
+        "Each answer on its own line. Bold number and letter, em dash, then explanation. No grouping, no compact rows, no bullet lists.\n"
+        "\n"
+        "Questions should test real understanding, not trivial details.\n"
+    ),
+}
+
+# Constant prompt text for _get_style_instruction — built once, not per call
+_STYLE_BASE_PREFIX = (
+    "IMPORTANT: You MUST now format the notes and save them by calling take_notes again with save_content. "
+    "Do NOT use the Write or Edit tools on notes files — ALWAYS use take_notes(save_content=...) for both initial save and any subsequent edits. "
+    "Do NOT leave the raw transcription as-is. Do NOT include YAML frontmatter — it is added automatically. "
+    "For any follow-up tool calls (chapters, search, deep_search, etc.), use the audio_path field from this response — do NOT guess the filename. "
+)
+
+
 def _get_style_instruction(
     style: str,
     read_aloud: bool = False,
@@ -1715,26 +2128,14 @@ def _get_style_instruction(
 ) -> str:
     """Return formatting instructions for a given note style."""
 
-    base_prefix = (
-        "IMPORTANT: You MUST now format the notes and save them by calling take_notes again with save_content. "
-        "Do NOT use the Write or Edit tools on notes files — ALWAYS use take_notes(save_content=...) for both initial save and any subsequent edits. "
-        "Do NOT leave the raw transcription as-is. Do NOT include YAML frontmatter — it is added automatically. "
-        "For any follow-up tool calls (chapters, search, deep_search, etc.), use the audio_path field from this response — do NOT guess the filename. "
-    )
     base_suffix = (
         '\n\nSave the final notes by calling: take_notes(save_content="<your formatted notes>"). '
         "Do NOT use the Write tool."
     )
 
     if read_aloud:
-        import os as _os
-        import shutil as _shutil
-
-        _obsidian_installed = _os.path.exists("/Applications/Obsidian.app") or bool(
-            _shutil.which("obsidian")
-        )
         audio_filename = f"{safe_title}.mp3" if safe_title else "notes_audio.mp3"
-        if _obsidian_installed:
+        if _obsidian_installed():
             embed_instruction = (
                 f"After TTS completes, prepend ![[{audio_filename}]] on the very first line "
                 f"(before the title) and `> Press Cmd+E before playing — prevents audio from pausing on scroll` "
@@ -1755,109 +2156,10 @@ def _get_style_instruction(
             + embed_instruction
         )
 
-    styles = {
-        "tldr": (
-            "Create the shortest possible summary. Must fit on one screen.\n"
-            "\n"
-            "FORMAT:\n"
-            "- Title as a top header\n"
-            "- Do NOT include source URL, duration, or date — frontmatter handles metadata\n"
-            "- ---\n"
-            "- One 2-3 sentence overview paragraph\n"
-            "- 5-8 bullet points max, each one line\n"
-            "- **Bold** the single most important term or name in each bullet\n"
-            "- No sections, no headers, no callouts, no quotes — just clean bullets\n"
-            "- End with one bold takeaway line\n"
-        ),
-        "notes": (
-            "Create clean, structured notes with clear hierarchy.\n"
-            "\n"
-            "FORMAT:\n"
-            "- Title as a top header\n"
-            "- Do NOT include source URL, duration, or date — frontmatter handles metadata\n"
-            "- ---\n"
-            "- 3-6 section headers based on the main topics\n"
-            "- Nested bullet points under each section (2 levels max)\n"
-            "- **Bold** key terms and names throughout\n"
-            "- Short paragraphs only — never more than 3 lines\n"
-            "- One > blockquote if there's a standout quote worth preserving\n"
-            "- Keep it scannable — someone should grasp the content in 60 seconds\n"
-        ),
-        "highlight": (
-            "Create formatted notes with visual emphasis on key insights.\n"
-            "\n"
-            "FORMAT:\n"
-            "- Title as a top header\n"
-            "- Do NOT include source URL, duration, or date — frontmatter handles metadata\n"
-            "- ---\n"
-            "- Section headers for each major topic\n"
-            "- Nested bullet points with **bold key terms**\n"
-            "- Use > [!tip] callout blocks for the 2-4 most important insights\n"
-            "- Use > [!info] callout blocks for definitions or context\n"
-            "- Use > blockquotes with timestamps for 2-3 key direct quotes\n"
-            "- Use **bold** and *italic* generously for emphasis\n"
-            "- Add a --- separator between major sections\n"
-            "- End with a Key Takeaways section using a > [!summary] callout\n"
-        ),
-        "eye-candy": (
-            "Create the most visually rich, beautifully formatted notes possible. "
-            "Every section should be a visual experience — the reader should absorb "
-            "the content by scanning, not reading.\n"
-            "\n"
-            "FORMAT:\n"
-            "- Title as a top header\n"
-            "- Do NOT include source URL, duration, or date — frontmatter handles metadata\n"
-            "- ---\n"
-            "- Section headers for every topic shift\n"
-            "- Nested bullet points (up to 3 levels) with **bold** and *italic*\n"
-            "- > [!tip] callout blocks for key insights (use liberally, 4-6 throughout)\n"
-            "- > [!info] callout blocks for context, background, definitions\n"
-            "- > [!warning] callout blocks for common mistakes or misconceptions\n"
-            "- > [!example] callout blocks for concrete examples mentioned\n"
-            "- > blockquotes with timestamps for 3-5 standout direct quotes\n"
-            "- Tables anywhere a comparison or list of items is discussed\n"
-            "- --- separators between major sections\n"
-            "- Checklists (- [ ]) for any action items or recommendations\n"
-            "- End with:\n"
-            "  1. A > [!summary] Key Takeaways callout with numbered list\n"
-            "  2. A table of Related Topics / Further Reading if applicable\n"
-            "\n"
-            "The goal: someone opens this file in Obsidian and says 'wow'.\n"
-        ),
-        "quiz": (
-            "Generate a multiple-choice quiz from the content. Do NOT write notes.\n"
-            "\n"
-            "FORMAT:\n"
-            "- Title as a top header with 'Quiz' appended\n"
-            "- Do NOT include source URL, duration, or date — frontmatter handles metadata\n"
-            "- ---\n"
-            "- 10-15 multiple-choice questions\n"
-            "- Each question MUST follow this EXACT structure:\n"
-            "\n"
-            "### 1. **Question text here?**\n"
-            "\n"
-            "A) First option\n"
-            "B) Second option\n"
-            "C) Third option\n"
-            "D) Fourth option\n"
-            "\n"
-            "- ---\n"
-            "- Answer Key section at the bottom with this EXACT format:\n"
-            "\n"
-            "## Answer Key\n"
-            "\n"
-            "**1. B** — Explanation of why B is correct.\n"
-            "**2. A** — Explanation of why A is correct.\n"
-            "**3. D** — Explanation of why D is correct.\n"
-            "\n"
-            "Each answer on its own line. Bold number and letter, em dash, then explanation. No grouping, no compact rows, no bullet lists.\n"
-            "\n"
-            "Questions should test real understanding, not trivial details.\n"
-        ),
-    }
-
-    body = styles.get(style, styles["notes"])
-    return base_prefix + body + base_suffix
+    # All style bodies are non-empty strings, so `or` is a safe fallback
+    # and skips the default lookup when the style is known
+    body = _STYLES.get(style) or _STYLES["notes"]
+    return _STYLE_BASE_PREFIX + body + base_suffix
 
 
 _last_notes_path = None
@@ -1865,11 +2167,15 @@ _last_notes_metadata = (
     {}
 )  # Stored during initial take_notes for frontmatter in save_content
 
+# Compiled once — these run on every take_notes save/transcribe call
+_ANS_BARE_RE = re.compile(r"^\s*[A-D]\)", re.MULTILINE)
+_ANS_SUB_RE = re.compile(r"^(\s*)([A-D]\))", re.MULTILINE)
+_TITLE_STRIP_RE = re.compile(r"[^\w\s\-]")
+_WS_RE = re.compile(r"\s+")
+
 
 def handle_take_notes(arguments: dict) -> dict:
     """Handle take_notes tool call - download, transcribe, save .md to Desktop."""
-    import os
-    import re
 
     global _last_notes_path, _last_notes_metadata
 
@@ -1886,10 +2192,8 @@ def handle_take_notes(arguments: dict) -> dict:
                 "No previous take_notes path. Call take_notes with a url first, or provide output_path."
             )
         # Post-process: convert plain A)/B)/C)/D) answer lines to checkbox syntax
-        had_bare = bool(re.search(r"^\s*[A-D]\)", save_content, flags=re.MULTILINE))
-        save_content = re.sub(
-            r"^(\s*)([A-D]\))", r"- [ ] \2", save_content, flags=re.MULTILINE
-        )
+        had_bare = bool(_ANS_BARE_RE.search(save_content))
+        save_content = _ANS_SUB_RE.sub(r"- [ ] \2", save_content)
         has_checkboxes = "- [ ]" in save_content
 
         # Strip any existing frontmatter from save_content (we generate our own)
@@ -1925,12 +2229,15 @@ def handle_take_notes(arguments: dict) -> dict:
             )
             save_content = frontmatter + "\n" + save_content
 
-        with open(_last_notes_path, "w", encoding="utf-8") as f:
-            f.write(save_content)
+        # Encode once and write bytes — skips TextIOWrapper's incremental
+        # encoding, which matters for large formatted notes
+        data = save_content.encode("utf-8")
+        with open(_last_notes_path, "wb") as f:
+            f.write(data)
         return {
             "success": True,
             "saved_to": _last_notes_path,
-            "size": len(save_content),
+            "size": len(data),
             "debug_checkbox": {
                 "had_bare_options": had_bare,
                 "has_checkboxes_after": has_checkboxes,
@@ -1941,9 +2248,7 @@ def handle_take_notes(arguments: dict) -> dict:
 
     cfg = get_config()
     url = arguments.get("url")
-    output_dir = arguments.get(
-        "output_dir", os.path.expanduser(cfg["notes_output_dir"])
-    )
+    output_dir = arguments.get("output_dir", _expanduser(cfg["notes_output_dir"]))
     model_size = arguments.get("model_size", cfg["model_size"])
     style = arguments.get("style", "notes")
     read_aloud = arguments.get("read_aloud", False)
@@ -1952,7 +2257,7 @@ def handle_take_notes(arguments: dict) -> dict:
     if not url:
         raise ValueError("Missing required parameter: url")
 
-    os.makedirs(output_dir, exist_ok=True)
+    _ensure_dir(output_dir)
 
     # Step 1: Download audio to ~/Downloads
     download_result = handle_download_audio({"url": url})
@@ -1982,18 +2287,22 @@ def handle_take_notes(arguments: dict) -> dict:
 
     # Step 3: Save raw transcription as .md on Desktop
     # Clean title for filename (remove special chars)
-    safe_title = re.sub(r"[^\w\s\-]", "", title)
-    safe_title = re.sub(r"\s+", " ", safe_title).strip()
+    safe_title = _TITLE_STRIP_RE.sub("", title)
+    safe_title = _WS_RE.sub(" ", safe_title).strip()
     if not safe_title:
         safe_title = "notes"
     md_filename = f"{safe_title}.md"
     md_path = os.path.join(output_dir, md_filename)
 
+    header = (
+        f"Source: {url}\n"
+        f"Duration: {int(duration // 60)}:{int(duration % 60):02d}\n"
+        f"Title: {title}\n" + "=" * 60 + "\n\n"
+    )
     with open(md_path, "w", encoding="utf-8") as f:
-        f.write(f"Source: {url}\n")
-        f.write(f"Duration: {int(duration // 60)}:{int(duration % 60):02d}\n")
-        f.write(f"Title: {title}\n")
-        f.write("=" * 60 + "\n\n")
+        # Header in one write, body in another — avoids concatenating the
+        # full transcription onto the header string
+        f.write(header)
         f.write(text)
 
     _last_notes_path = md_path
@@ -2376,11 +2685,6 @@ _tts_jobs = {}
 
 def handle_text_to_speech(arguments: dict) -> dict:
     """Handle text_to_speech tool call. Runs in background subprocess, returns instantly."""
-    import os
-    import shutil
-    import subprocess
-    import tempfile
-    import uuid
 
     # Check status of a running job
     job_id = arguments.get("job_id")
@@ -2396,17 +2700,12 @@ def handle_text_to_speech(arguments: dict) -> dict:
                 "job_id": job_id,
                 "message": "TTS is still running. Check again in a few seconds.",
             }
-        # Done — read result
-        stdout = proc.stdout.read()
-        proc.stdout.close()
-        try:
-            os.unlink(job["script"])
-        except OSError:
-            pass
+        # Done — drain the pipe and reap the child in one call
+        stdout, _ = proc.communicate()
         if poll != 0:
             del _tts_jobs[job_id]
             raise RuntimeError("TTS generation failed")
-        result = json.loads(stdout.strip())
+        result = json.loads(stdout)
         if "error" in result:
             del _tts_jobs[job_id]
             raise RuntimeError(result["error"])
@@ -2428,50 +2727,33 @@ def handle_text_to_speech(arguments: dict) -> dict:
     if not text and not file_path:
         raise ValueError("Either text or file_path is required")
 
-    # Build a Python script to run TTS in a completely separate process
-    script = f"""
-import json, sys, os
-_real_stdout = os.dup(1)
-sys.stdout = open('/dev/null', 'w')
-sys.stderr = open('/dev/null', 'w')
-os.dup2(os.open('/dev/null', os.O_WRONLY), 1)
-os.dup2(os.open('/dev/null', os.O_WRONLY), 2)
-from augent.tts import text_to_speech, read_aloud
-try:
-    if {repr(file_path)}:
-        result = read_aloud({repr(file_path)}, voice={repr(voice)}, speed={speed})
-    else:
-        result = text_to_speech(
-            text={repr(text)},
-            voice={repr(voice)},
-            output_dir={repr(output_dir)},
-            output_filename={repr(output_filename)},
-            speed={speed},
-        )
-    os.dup2(_real_stdout, 1)
-    sys.stdout = os.fdopen(_real_stdout, 'w')
-    print(json.dumps(result))
-except Exception as e:
-    os.dup2(_real_stdout, 1)
-    sys.stdout = os.fdopen(_real_stdout, 'w')
-    print(json.dumps({{"error": str(e)}}))
-"""
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(script)
-        script_path = f.name
-
+    # Run TTS in the static worker module (bytecode-cached, no tempfile),
+    # passing arguments as one JSON line on stdin
     python_bin = shutil.which("python3") or sys.executable
+    # Binary pipes: json.loads takes the result bytes directly, skipping
+    # the TextIOWrapper decode on both ends. No preexec_fn / pass_fds /
+    # cwd here — that keeps CPython on the posix_spawn fast path instead
+    # of fork+exec, which matters when the server's heap holds a loaded
+    # Whisper model
     proc = subprocess.Popen(
-        [python_bin, script_path],
-        stdin=subprocess.DEVNULL,
+        [python_bin, "-m", "augent._tts_worker"],
+        stdin=subprocess.PIPE,
         stdout=subprocess.PIPE,
         stderr=subprocess.DEVNULL,
-        text=True,
     )
+    payload = {
+        "text": text,
+        "file_path": file_path,
+        "voice": voice,
+        "output_dir": output_dir,
+        "output_filename": output_filename,
+        "speed": speed,
+    }
+    proc.stdin.write(json.dumps(payload).encode("utf-8") + b"\n")
+    proc.stdin.close()
 
     job_id = str(uuid.uuid4())[:8]
-    _tts_jobs[job_id] = {"proc": proc, "script": script_path}
+    _tts_jobs[job_id] = {"proc": proc}
 
     return {
         "status": "started",
@@ -2856,127 +3138,127 @@ def _score_visual_necessity(segments: list, segment_embeddings=None) -> list:
     VISUAL_PATTERNS = [
         # Explicit visual references
         (
-            _re.compile(
+            re.compile(
                 r"\b(as you can see|you can see|you'll see|see here|shown here|look at)\b",
-                _re.I,
+                re.I,
             ),
             0.9,
             "explicit visual reference",
         ),
         (
-            _re.compile(r"\b(on screen|on the screen|on your screen)\b", _re.I),
+            re.compile(r"\b(on screen|on the screen|on your screen)\b", re.I),
             0.9,
             "on-screen reference",
         ),
         (
-            _re.compile(
+            re.compile(
                 r"\b(here'?s what it looks like|this is what it looks like|looks like this)\b",
-                _re.I,
+                re.I,
             ),
             0.9,
             "visual demonstration",
         ),
         # UI actions
         (
-            _re.compile(
+            re.compile(
                 r"\b(click|tap|press|hit|select|toggle|check|uncheck)\s+(on|the|this|that|here)\b",
-                _re.I,
+                re.I,
             ),
             0.85,
             "UI action",
         ),
         (
-            _re.compile(r"\b(drag|drop|swipe|scroll|hover)\b", _re.I),
+            re.compile(r"\b(drag|drop|swipe|scroll|hover)\b", re.I),
             0.85,
             "spatial UI action",
         ),
         (
-            _re.compile(
+            re.compile(
                 r"\b(navigate to|go to|open up|expand|collapse|minimize|maximize)\b",
-                _re.I,
+                re.I,
             ),
             0.75,
             "navigation action",
         ),
         # UI elements
         (
-            _re.compile(
+            re.compile(
                 r"\b(button|icon|menu|dropdown|sidebar|toolbar|popup|modal|dialog|tooltip)\b",
-                _re.I,
+                re.I,
             ),
             0.7,
             "UI element reference",
         ),
         (
-            _re.compile(
+            re.compile(
                 r"\b(dashboard|chart|graph|table|spreadsheet|form|field|checkbox|slider)\b",
-                _re.I,
+                re.I,
             ),
             0.7,
             "data visualization",
         ),
         # Spatial/positional
         (
-            _re.compile(
+            re.compile(
                 r"\b(top right|top left|bottom right|bottom left|upper right|upper left|lower right|lower left)\b",
-                _re.I,
+                re.I,
             ),
             0.8,
             "spatial position",
         ),
         (
-            _re.compile(
+            re.compile(
                 r"\b(over here|right here|right there|over there|this area|this section|this part)\b",
-                _re.I,
+                re.I,
             ),
             0.85,
             "deictic reference",
         ),
         # Demonstration language
         (
-            _re.compile(
+            re.compile(
                 r"\b(let me show|i'll show|i'm going to show|watch what happens|watch this|notice how)\b",
-                _re.I,
+                re.I,
             ),
             0.85,
             "demonstration",
         ),
         (
-            _re.compile(
+            re.compile(
                 r"\b(step \d|first.{0,20}(click|select|open|type|enter)|next.{0,20}(click|select|open|type))\b",
-                _re.I,
+                re.I,
             ),
             0.8,
             "step-by-step instruction",
         ),
         # Code/terminal
         (
-            _re.compile(
+            re.compile(
                 r"\b(the (code|output|error|terminal|console) (shows|says|reads|displays))\b",
-                _re.I,
+                re.I,
             ),
             0.75,
             "code/terminal output",
         ),
         (
-            _re.compile(
+            re.compile(
                 r"\b(type|enter|run|execute|paste)\s+(this|the command|the following|in the)\b",
-                _re.I,
+                re.I,
             ),
             0.7,
             "command input",
         ),
         # Screen recording cues
         (
-            _re.compile(
+            re.compile(
                 r"\b(recording|screen share|screen cast|let me walk you through)\b",
-                _re.I,
+                re.I,
             ),
             0.7,
             "screen recording",
         ),
         (
-            _re.compile(r"\b(you('ll| will) (notice|see|find))\b", _re.I),
+            re.compile(r"\b(you('ll| will) (notice|see|find))\b", re.I),
             0.75,
             "visual callout",
         ),
@@ -3117,7 +3399,6 @@ def _extract_best_frame(
     visual information (highest edge density = most UI/text content).
     Returns True if a frame was saved to out_path.
     """
-    import tempfile
 
     candidates = []
     offsets = [0.0, 1.0, 2.0]
@@ -3178,7 +3459,6 @@ def _extract_best_frame(
     best_path = candidates[0][0]
 
     # Move best to output, clean up others
-    import shutil
 
     shutil.move(best_path, out_path)
     for path, _ in candidates:
@@ -3261,7 +3541,6 @@ def _dedup_frames(frame_info: list) -> list:
 
 def handle_visual(arguments: dict) -> dict:
     """Handle visual tool call — extract frames at moments that matter."""
-    import shutil
     from pathlib import Path
 
     from .config import get_config
@@ -3291,7 +3570,7 @@ def handle_visual(arguments: dict) -> dict:
         ) or shutil.which("yt-dlp")
         if not ytdlp:
             raise RuntimeError("yt-dlp not found. Install with: brew install yt-dlp")
-        download_dir = os.path.expanduser("~/Downloads")
+        download_dir = _expanduser("~/Downloads")
         cmd = [
             ytdlp,
             "-f",
@@ -3342,7 +3621,7 @@ def handle_visual(arguments: dict) -> dict:
 
     # Handle clear: remove all frames and visual context .md for this video
     video_stem_for_clear = os.path.splitext(os.path.basename(video_path))[0]
-    safe_name_for_clear = _re.sub(r"[^\w\s-]", "", video_stem_for_clear).strip()[:80]
+    safe_name_for_clear = re.sub(r"[^\w\s-]", "", video_stem_for_clear).strip()[:80]
     if clear:
         vault_dir = _get_obsidian_vault()
         removed_frames = 0
@@ -3361,7 +3640,7 @@ def handle_visual(arguments: dict) -> dict:
         # Remove visual context .md from Desktop
         md_name = f"{safe_name_for_clear} - Visual Context.md"
         md_desktop = (
-            Path(os.path.expanduser(cfg.get("notes_output_dir", "~/Desktop"))) / md_name
+            Path(_expanduser(cfg.get("notes_output_dir", "~/Desktop"))) / md_name
         )
         if md_desktop.exists():
             md_desktop.unlink()
@@ -3660,9 +3939,9 @@ def handle_visual(arguments: dict) -> dict:
 
     # Frame storage
     video_stem = os.path.splitext(os.path.basename(video_path))[0]
-    safe_name = _re.sub(r"[^\w\s-]", "", video_stem).strip()[:80]
+    safe_name = re.sub(r"[^\w\s-]", "", video_stem).strip()[:80]
     # Short prefix for frame filenames (unique per video, readable in Obsidian)
-    name_prefix = _re.sub(r"[^\w]", "_", safe_name).strip("_")[:40].lower().rstrip("_")
+    name_prefix = re.sub(r"[^\w]", "_", safe_name).strip("_")[:40].lower().rstrip("_")
 
     # Frames go directly into the Obsidian vault so ![[]] embeds resolve.
     # The .md goes to Desktop — augent-obsidian hard-links it into the vault.
@@ -3673,7 +3952,7 @@ def handle_visual(arguments: dict) -> dict:
         desktop_dir = str(vault_dir / "External Files" / "visual" / safe_name)
     else:
         desktop_dir = os.path.join(
-            os.path.expanduser(cfg.get("notes_output_dir", "~/Desktop")),
+            _expanduser(cfg.get("notes_output_dir", "~/Desktop")),
             "visual",
             safe_name,
         )
@@ -3712,7 +3991,7 @@ def handle_visual(arguments: dict) -> dict:
         try:
             md_name = f"{safe_name} - Visual Context.md"
             md_path = os.path.join(
-                os.path.expanduser(cfg.get("notes_output_dir", "~/Desktop")),
+                _expanduser(cfg.get("notes_output_dir", "~/Desktop")),
                 md_name,
             )
 
@@ -3733,9 +4012,7 @@ def handle_visual(arguments: dict) -> dict:
                 md_lines.append(f"![[{fi['filename']}]]")
                 md_lines.append("")
                 if fi.get("transcript"):
-                    clean_transcript = _re.sub(
-                        r"\*\*(.+?)\*\*", r"\1", fi["transcript"]
-                    )
+                    clean_transcript = re.sub(r"\*\*(.+?)\*\*", r"\1", fi["transcript"])
                     md_lines.append(f"> {clean_transcript[:300]}")
                     md_lines.append("")
 
@@ -3767,9 +4044,7 @@ def handle_clip_export(arguments: dict) -> dict:
     url = arguments.get("url")
     start = arguments.get("start")
     end = arguments.get("end")
-    output_dir = arguments.get(
-        "output_dir", os.path.expanduser(cfg["notes_output_dir"])
-    )
+    output_dir = arguments.get("output_dir", _expanduser(cfg["notes_output_dir"]))
     output_filename = arguments.get("output_filename")
 
     if not url:
@@ -3780,7 +4055,7 @@ def handle_clip_export(arguments: dict) -> dict:
         raise ValueError("end must be greater than start")
 
     output_dir = os.path.expanduser(output_dir)
-    os.makedirs(output_dir, exist_ok=True)
+    _ensure_dir(output_dir)
 
     ytdlp = shutil.which(
         "yt-dlp", path="/opt/homebrew/bin:/usr/local/bin"
@@ -3928,7 +4203,7 @@ def _spaces_download(arguments: dict) -> dict:
     import glob as glob_module
 
     url = arguments.get("url")
-    output_dir = arguments.get("output_dir", os.path.expanduser("~/Downloads"))
+    output_dir = arguments.get("output_dir", _expanduser("~/Downloads"))
 
     if not url:
         raise ValueError("Missing required parameter: url")
@@ -3937,7 +4212,7 @@ def _spaces_download(arguments: dict) -> dict:
     if not cookies_path:
         raise FileNotFoundError(_SPACES_SETUP_INSTRUCTIONS)
 
-    os.makedirs(output_dir, exist_ok=True)
+    _ensure_dir(output_dir)
     url = _normalize_twitter_space_url(url)
 
     meta_cmd = [
@@ -4168,39 +4443,101 @@ def _spaces_stop(arguments: dict) -> dict:
     }
 
 
+# O(1) tool dispatch for handle_tools_call — declared after the handlers
+# so plugin-style registration stays possible
+_TOOL_HANDLERS = {
+    "download_audio": handle_download_audio,
+    "transcribe_audio": handle_transcribe_audio,
+    "search_audio": handle_search_audio,
+    "deep_search": handle_deep_search,
+    "take_notes": handle_take_notes,
+    "chapters": handle_chapters,
+    "batch_search": handle_batch_search,
+    "text_to_speech": handle_text_to_speech,
+    "search_proximity": handle_search_proximity,
+    "identify_speakers": handle_identify_speakers,
+    "list_files": handle_list_files,
+    "list_memories": handle_list_memories,
+    "memory_stats": handle_memory_stats,
+    "clear_memory": handle_clear_memory,
+    "search_memory": handle_search_memory,
+    "separate_audio": handle_separate_audio,
+    "clip_export": handle_clip_export,
+    "highlights": handle_highlights,
+    "tag": handle_tag,
+    "rebuild_graph": handle_rebuild_graph,
+    "visual": handle_visual,
+    "spaces": handle_spaces,
+}
+
+
+def _run_tool_call(id: Any, params: dict) -> None:
+    """Run handle_tools_call on a pool thread, never letting it raise."""
+    try:
+        handle_tools_call(id, params)
+    except Exception as e:
+        send_error(id, -32603, f"Internal error: {str(e)}")
+
+
+_METHODS = {
+    "initialize": lambda id, params: handle_initialize(id, params),
+    "tools/list": lambda id, params: handle_tools_list(id),
+    # Off the main loop — a long transcription must not block the
+    # stdin reader or responses to cheaper tools
+    "tools/call": lambda id, params: _POOL.submit(_run_tool_call, id, params),
+    "notifications/initialized": None,  # No response needed for notifications
+}
+
+
 def handle_request(request: dict) -> None:
     """Route JSON-RPC request to appropriate handler."""
     method = request.get("method")
     id = request.get("id")
     params = request.get("params", {})
 
-    if method == "initialize":
-        handle_initialize(id, params)
-    elif method == "notifications/initialized":
-        pass  # No response needed for notifications
-    elif method == "tools/list":
-        handle_tools_list(id)
-    elif method == "tools/call":
-        handle_tools_call(id, params)
-    else:
+    try:
+        fn = _METHODS[method]
+    except KeyError:
         if id is not None:
             send_error(id, -32601, f"Method not found: {method}")
+        return
+    if fn is not None:
+        fn(id, params)
+
+
+def _dispatch_line(line: bytes, loads) -> None:
+    """Parse one JSON-RPC message and route it."""
+    try:
+        handle_request(loads(line))
+    except ValueError:
+        # covers both json.JSONDecodeError and orjson.JSONDecodeError
+        send_error(None, -32700, "Parse error")
+    except Exception as e:
+        send_error(None, -32603, f"Internal error: {str(e)}")
 
 
 def main() -> None:
     """Main MCP server loop."""
-    for line in sys.stdin:
-        line = line.strip()
-        if not line:
+    # Read raw bytes in chunks and feed them straight to the JSON parser:
+    # skips TextIOWrapper's UTF-8 decode and the per-line strip allocation,
+    # and drains several queued messages per syscall under bursty traffic
+    loads = json.loads if orjson is None else orjson.loads
+    reader = sys.stdin.buffer
+    pending = bytearray()
+    while True:
+        chunk = reader.read1(65536)
+        if not chunk:
+            break
+        pending += chunk
+        if b"\n" not in chunk:
             continue
-
-        try:
-            request = json.loads(line)
-            handle_request(request)
-        except json.JSONDecodeError:
-            send_error(None, -32700, "Parse error")
-        except Exception as e:
-            send_error(None, -32603, f"Internal error: {str(e)}")
+        *lines, rest = pending.split(b"\n")
+        pending = bytearray(rest)
+        for line in lines:
+            if line and not line.isspace():
+                _dispatch_line(line, loads)
+    if pending and not pending.isspace():
+        _dispatch_line(bytes(pending), loads)
 
 
 if __name__ == "__main__":
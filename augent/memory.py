@@ -107,9 +107,19 @@ class TranscriptionMemory:
                     segment_count INTEGER,
                     embedding_dim INTEGER,
                     embeddings BLOB,
-                    created_at REAL
+                    created_at REAL,
+                    normalized INTEGER DEFAULT 0
                 )
             """)
+
+            # Migration: add normalized flag for existing DBs
+            try:
+                conn.execute(
+                    "ALTER TABLE embeddings ADD COLUMN normalized INTEGER DEFAULT 0"
+                )
+            except sqlite3.OperationalError:
+                pass  # Column already exists
+
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_embeddings_hash
                 ON embeddings(audio_hash)
@@ -1028,6 +1038,7 @@ class TranscriptionMemory:
                         ).reshape(row["segment_count"], row["embedding_dim"]),
                         "segment_count": row["segment_count"],
                         "embedding_dim": row["embedding_dim"],
+                        "normalized": bool(row["normalized"]),
                     }
         except Exception:
             return None
@@ -1039,8 +1050,13 @@ class TranscriptionMemory:
         embeddings,
         segment_count: int,
         embedding_dim: int,
+        normalized: bool = False,
     ) -> None:
-        """Store embeddings in memory. embeddings should be a numpy ndarray."""
+        """Store embeddings in memory. embeddings should be a numpy ndarray.
+
+        normalized=True records that rows are unit-length, letting readers
+        skip norm computation.
+        """
         cache_key = self._embeddings_cache_key(audio_hash, embedding_model)
         blob = embeddings.astype("float32").tobytes()
         try:
@@ -1050,8 +1066,8 @@ class TranscriptionMemory:
                         """
                         INSERT OR REPLACE INTO embeddings
                         (cache_key, audio_hash, embedding_model, segment_count,
-                         embedding_dim, embeddings, created_at)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                         embedding_dim, embeddings, created_at, normalized)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                     """,
                         (
                             cache_key,
@@ -1061,6 +1077,7 @@ class TranscriptionMemory:
                             embedding_dim,
                             blob,
                             time.time(),
+                            int(normalized),
                         ),
                     )
                     conn.commit()
@@ -1444,12 +1461,14 @@ class ModelCache:
             if cache_key not in self._models:
                 from faster_whisper import WhisperModel
 
-                # Determine compute type based on device if auto
+                # Determine compute type based on device if auto:
+                # int8 weights halve memory bandwidth on both targets;
+                # fp16 activations keep CUDA accuracy
                 if compute_type == "auto":
                     import torch
 
                     if torch.cuda.is_available():
-                        compute_type = "float16"
+                        compute_type = "int8_float16"
                     else:
                         compute_type = "int8"
 
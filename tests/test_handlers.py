@@ -32,30 +32,35 @@ from augent.mcp import (
 class TestDownloadAudio:
     """Tests for handle_download_audio."""
 
-    def _mock_run(self, stdout="", returncode=0):
-        return mock.patch(
-            "subprocess.run",
-            return_value=mock.Mock(stdout=stdout, stderr="", returncode=returncode),
-        )
+    def _mock_ydl(self, filepath="", error=None):
+        """Patch the in-process YoutubeDL class with a mock instance."""
+        ydl = mock.MagicMock()
+        if error is not None:
+            ydl.extract_info.side_effect = error
+        else:
+            ydl.extract_info.return_value = {
+                "requested_downloads": [{"filepath": filepath}]
+            }
+        factory = mock.MagicMock(return_value=ydl)
+        return mock.patch("augent.mcp.YoutubeDL", factory)
 
     def test_missing_url_raises(self):
         with pytest.raises(ValueError, match="Missing required parameter: url"):
             handle_download_audio({})
 
-    def test_restrict_filenames_flag(self):
-        """--restrict-filenames must be in the yt-dlp command."""
+    def test_restrict_filenames_option(self):
+        """restrictfilenames must be enabled in the yt-dlp options."""
         with tempfile.TemporaryDirectory() as tmpdir:
             fake_file = os.path.join(tmpdir, "test.webm")
             open(fake_file, "w").close()
 
-            with self._mock_run(stdout=fake_file) as mock_run:
-                with mock.patch("shutil.which", return_value="/usr/bin/yt-dlp"):
-                    handle_download_audio(
-                        {"url": "https://youtube.com/watch?v=abc", "output_dir": tmpdir}
-                    )
+            with self._mock_ydl(filepath=fake_file) as mock_ydl:
+                handle_download_audio(
+                    {"url": "https://youtube.com/watch?v=abc", "output_dir": tmpdir}
+                )
 
-                cmd = mock_run.call_args[0][0]
-                assert "--restrict-filenames" in cmd
+                opts = mock_ydl.call_args[0][0]
+                assert opts["restrictfilenames"] is True
 
     def test_output_template_format(self):
         """Output template should use %(title)s [%(id)s].%(ext)s."""
@@ -63,25 +68,22 @@ class TestDownloadAudio:
             fake_file = os.path.join(tmpdir, "test.webm")
             open(fake_file, "w").close()
 
-            with self._mock_run(stdout=fake_file) as mock_run:
-                with mock.patch("shutil.which", return_value="/usr/bin/yt-dlp"):
-                    handle_download_audio(
-                        {"url": "https://example.com/video", "output_dir": tmpdir}
-                    )
+            with self._mock_ydl(filepath=fake_file) as mock_ydl:
+                handle_download_audio(
+                    {"url": "https://example.com/video", "output_dir": tmpdir}
+                )
 
-                cmd = mock_run.call_args[0][0]
-                o_idx = cmd.index("-o")
-                template = cmd[o_idx + 1]
+                template = mock_ydl.call_args[0][0]["outtmpl"]
                 assert "%(title)s" in template
                 assert "%(id)s" in template
 
-    def test_aria2c_flags_added_when_available(self):
-        """When aria2c is on PATH, downloader flags should be added."""
+    def test_aria2c_options_added_when_available(self):
+        """When aria2c is on PATH, external downloader options should be set."""
         with tempfile.TemporaryDirectory() as tmpdir:
             fake_file = os.path.join(tmpdir, "test.webm")
             open(fake_file, "w").close()
 
-            with self._mock_run(stdout=fake_file) as mock_run:
+            with self._mock_ydl(filepath=fake_file) as mock_ydl:
                 with mock.patch(
                     "shutil.which", side_effect=lambda name, **kw: "/usr/bin/" + name
                 ):
@@ -89,43 +91,37 @@ class TestDownloadAudio:
                         {"url": "https://example.com/v", "output_dir": tmpdir}
                     )
 
-                cmd = mock_run.call_args[0][0]
-                assert "--downloader" in cmd
-                assert "aria2c" in cmd
+                opts = mock_ydl.call_args[0][0]
+                assert opts["external_downloader"] == {"default": "aria2c"}
+                assert "aria2c" in opts["external_downloader_args"]
 
-    def test_aria2c_flags_absent_when_missing(self):
-        """When aria2c is not on PATH, downloader flags should be absent."""
+    def test_aria2c_options_absent_when_missing(self):
+        """When aria2c is not on PATH, external downloader options should be absent."""
         with tempfile.TemporaryDirectory() as tmpdir:
             fake_file = os.path.join(tmpdir, "test.webm")
             open(fake_file, "w").close()
 
-            def which_side_effect(name, **kwargs):
-                if name == "yt-dlp":
-                    return "/usr/bin/yt-dlp"
-                return None  # aria2c not found
-
-            with self._mock_run(stdout=fake_file) as mock_run:
-                with mock.patch("shutil.which", side_effect=which_side_effect):
+            with self._mock_ydl(filepath=fake_file) as mock_ydl:
+                with mock.patch("shutil.which", return_value=None):
                     handle_download_audio(
                         {"url": "https://example.com/v", "output_dir": tmpdir}
                     )
 
-                cmd = mock_run.call_args[0][0]
-                assert "--downloader" not in cmd
+                opts = mock_ydl.call_args[0][0]
+                assert "external_downloader" not in opts
 
     def test_yt_dlp_not_found_raises(self):
-        with mock.patch("shutil.which", return_value=None):
+        with mock.patch("augent.mcp.YoutubeDL", None):
             with pytest.raises(RuntimeError, match="yt-dlp not found"):
                 handle_download_audio({"url": "https://example.com/v"})
 
     def test_download_failure_raises(self):
         with tempfile.TemporaryDirectory() as tmpdir:
-            with self._mock_run(stdout="", returncode=1):
-                with mock.patch("shutil.which", return_value="/usr/bin/yt-dlp"):
-                    with pytest.raises(RuntimeError, match="Download failed"):
-                        handle_download_audio(
-                            {"url": "https://example.com/v", "output_dir": tmpdir}
-                        )
+            with self._mock_ydl(error=RuntimeError("network unreachable")):
+                with pytest.raises(RuntimeError, match="Download failed"):
+                    handle_download_audio(
+                        {"url": "https://example.com/v", "output_dir": tmpdir}
+                    )
 
     def test_registers_source_url(self):
         """Downloaded file should be tracked in _downloaded_urls."""
@@ -133,21 +129,20 @@ class TestDownloadAudio:
             fake_file = os.path.join(tmpdir, "test.webm")
             open(fake_file, "w").close()
 
-            with self._mock_run(stdout=fake_file):
-                with mock.patch("shutil.which", return_value="/usr/bin/yt-dlp"):
-                    with mock.patch.dict("augent.mcp._downloaded_urls", {}, clear=True):
-                        from augent import mcp
+            with self._mock_ydl(filepath=fake_file):
+                with mock.patch.dict("augent.mcp._downloaded_urls", {}, clear=True):
+                    from augent import mcp
 
-                        handle_download_audio(
-                            {
-                                "url": "https://youtube.com/watch?v=test123",
-                                "output_dir": tmpdir,
-                            }
-                        )
-                        assert (
-                            mcp._downloaded_urls[os.path.abspath(fake_file)]
-                            == "https://youtube.com/watch?v=test123"
-                        )
+                    handle_download_audio(
+                        {
+                            "url": "https://youtube.com/watch?v=test123",
+                            "output_dir": tmpdir,
+                        }
+                    )
+                    assert (
+                        mcp._downloaded_urls[os.path.abspath(fake_file)]
+                        == "https://youtube.com/watch?v=test123"
+                    )
 
     def test_success_response_shape(self):
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -155,32 +150,47 @@ class TestDownloadAudio:
             with open(fake_file, "wb") as f:
                 f.write(b"x" * (1024 * 1024 + 1))  # just over 1 MB
 
-            with self._mock_run(stdout=fake_file):
-                with mock.patch("shutil.which", return_value="/usr/bin/yt-dlp"):
-                    result = handle_download_audio(
-                        {"url": "https://example.com/v", "output_dir": tmpdir}
-                    )
+            with self._mock_ydl(filepath=fake_file):
+                result = handle_download_audio(
+                    {"url": "https://example.com/v", "output_dir": tmpdir}
+                )
 
             assert result["success"] is True
             assert result["file"]["path"] == fake_file
             assert result["file"]["size_mb"] > 0
             assert result["url"] == "https://example.com/v"
 
-    def test_concurrent_fragments_flag(self):
-        """--concurrent-fragments 4 should always be present."""
+    def test_concurrent_fragments_option(self):
+        """concurrent_fragment_downloads scales with CPU count, within 4-16."""
         with tempfile.TemporaryDirectory() as tmpdir:
             fake_file = os.path.join(tmpdir, "test.webm")
             open(fake_file, "w").close()
 
-            with self._mock_run(stdout=fake_file) as mock_run:
-                with mock.patch("shutil.which", return_value="/usr/bin/yt-dlp"):
-                    handle_download_audio(
-                        {"url": "https://example.com/v", "output_dir": tmpdir}
-                    )
+            with self._mock_ydl(filepath=fake_file) as mock_ydl:
+                handle_download_audio(
+                    {"url": "https://example.com/v", "output_dir": tmpdir}
+                )
 
-                cmd = mock_run.call_args[0][0]
-                idx = cmd.index("--concurrent-fragments")
-                assert cmd[idx + 1] == "4"
+                opts = mock_ydl.call_args[0][0]
+                assert 4 <= opts["concurrent_fragment_downloads"] <= 16
+
+    def test_prepare_filename_fallback(self):
+        """When requested_downloads is absent, prepare_filename supplies the path."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fake_file = os.path.join(tmpdir, "test.webm")
+            open(fake_file, "w").close()
+
+            ydl = mock.MagicMock()
+            ydl.extract_info.return_value = {"title": "test"}
+            ydl.prepare_filename.return_value = fake_file
+            factory = mock.MagicMock(return_value=ydl)
+
+            with mock.patch("augent.mcp.YoutubeDL", factory):
+                result = handle_download_audio(
+                    {"url": "https://example.com/v", "output_dir": tmpdir}
+                )
+
+            assert result["file"]["path"] == fake_file
 
 
 # ---------------------------------------------------------------------------
@@ -511,7 +521,9 @@ class TestTranscribeAudio:
 
             assert result["text"] == "hello world"
             assert result["language"] == "en"
-            mock_transcribe.assert_called_once_with(audio_path, "tiny")
+            mock_transcribe.assert_called_once_with(
+                audio_path, "tiny", compute_type="auto", vad_filter=True
+            )
         finally:
             os.unlink(audio_path)
 
@@ -798,6 +810,52 @@ class TestBatchSearch:
         finally:
             os.unlink(path)
 
+    @mock.patch("augent.mcp.search_audio")
+    def test_progress_notification_per_file(self, mock_search):
+        """Each processed file should emit a notifications/progress message."""
+        mock_search.return_value = {}
+
+        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f1:
+            path1 = f1.name
+        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f2:
+            path2 = f2.name
+
+        try:
+            with mock.patch("augent.mcp.send_notification") as mock_notify:
+                handle_batch_search(
+                    {
+                        "audio_paths": [path1, path2],
+                        "keywords": ["kw"],
+                        "_progress_token": 7,
+                    }
+                )
+
+            assert mock_notify.call_count == 2
+            method, params = mock_notify.call_args[0]
+            assert method == "notifications/progress"
+            assert params["progressToken"] == 7
+            assert params["progress"] == 2
+            assert params["total"] == 2
+        finally:
+            os.unlink(path1)
+            os.unlink(path2)
+
+    @mock.patch("augent.mcp.search_audio")
+    def test_no_progress_notification_without_token(self, mock_search):
+        """No progressToken from the client means no progress messages."""
+        mock_search.return_value = {}
+
+        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
+            path = f.name
+
+        try:
+            with mock.patch("augent.mcp.send_notification") as mock_notify:
+                handle_batch_search({"audio_paths": [path], "keywords": ["kw"]})
+
+            mock_notify.assert_not_called()
+        finally:
+            os.unlink(path)
+
     @mock.patch("augent.mcp.search_audio")
     def test_search_error_captured(self, mock_search):
         """If search_audio throws for a file, error is captured not raised."""
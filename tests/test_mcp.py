@@ -26,6 +26,7 @@ from augent.mcp import (
     handle_tools_call,
     handle_tools_list,
     send_error,
+    send_notification,
     send_response,
 )
 
@@ -54,6 +55,15 @@ class TestSendResponse:
         assert resp["error"]["code"] == -32600
         assert resp["error"]["message"] == "Bad request"
 
+    def test_sends_notification_without_id(self):
+        resp = capture_stdout(
+            send_notification, "notifications/progress", {"progress": 1, "total": 2}
+        )
+        assert resp["jsonrpc"] == "2.0"
+        assert resp["method"] == "notifications/progress"
+        assert resp["params"]["progress"] == 1
+        assert "id" not in resp
+
 
 # --- Initialize ---
 
@@ -74,8 +84,15 @@ class TestInitialize:
 # --- Tools list ---
 
 
+@pytest.fixture
+def all_deps_available():
+    """Pretend every optional dependency is installed."""
+    with mock.patch("augent.mcp._unavailable_tools", return_value=frozenset()):
+        yield
+
+
 class TestToolsList:
-    def test_returns_22_tools(self):
+    def test_returns_22_tools(self, all_deps_available):
         resp = capture_stdout(handle_tools_list, 1)
         tools = resp["result"]["tools"]
         assert len(tools) == 22
@@ -88,7 +105,7 @@ class TestToolsList:
             assert "inputSchema" in tool
             assert tool["inputSchema"]["type"] == "object"
 
-    def test_expected_tool_names(self):
+    def test_expected_tool_names(self, all_deps_available):
         resp = capture_stdout(handle_tools_list, 1)
         names = {t["name"] for t in resp["result"]["tools"]}
         expected = {
@@ -117,7 +134,7 @@ class TestToolsList:
         }
         assert names == expected
 
-    def test_disabled_tools_filtered(self):
+    def test_disabled_tools_filtered(self, all_deps_available):
         """Config disabled_tools should hide tools from the list."""
         import augent.config as config_mod
 
@@ -133,6 +150,18 @@ class TestToolsList:
         finally:
             config_mod._config = original
 
+    def test_unavailable_tools_hidden(self):
+        """Tools whose optional dependency is missing should not be listed."""
+        with mock.patch(
+            "augent.mcp._unavailable_tools",
+            return_value=frozenset({"text_to_speech", "deep_search"}),
+        ):
+            resp = capture_stdout(handle_tools_list, 1)
+            names = {t["name"] for t in resp["result"]["tools"]}
+            assert "text_to_speech" not in names
+            assert "deep_search" not in names
+            assert "search_audio" in names
+
     def test_disabled_tool_call_blocked(self):
         """Calling a disabled tool should return an error."""
         import augent.config as config_mod
@@ -229,6 +258,31 @@ class TestListFiles:
             result_deep = handle_list_files({"directory": tmpdir, "recursive": True})
             assert result_deep["count"] == 2
 
+    def test_hidden_files_skipped(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            open(os.path.join(tmpdir, ".hidden.mp3"), "w").close()
+            open(os.path.join(tmpdir, "visible.mp3"), "w").close()
+
+            result = handle_list_files({"directory": tmpdir})
+            assert result["count"] == 1
+            assert result["files"][0]["name"] == "visible.mp3"
+
+            result = handle_list_files({"directory": tmpdir, "pattern": "*.mp3"})
+            assert result["count"] == 1
+
+    def test_pattern_case_insensitive(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            open(os.path.join(tmpdir, "Song.MP3"), "w").close()
+
+            assert (
+                handle_list_files({"directory": tmpdir, "pattern": "*.mp3"})["count"]
+                == 1
+            )
+            assert (
+                handle_list_files({"directory": tmpdir, "pattern": "s?ng.mp3"})["count"]
+                == 1
+            )
+
     def test_missing_directory_raises(self):
         with pytest.raises(ValueError, match="Missing required"):
             handle_list_files({})
@@ -370,8 +424,8 @@ class TestSearchMemory:
         assert "output" in schema["inputSchema"]["properties"]
 
     def test_routes_correctly(self):
-        with mock.patch("augent.mcp.handle_search_memory") as mock_handler:
-            mock_handler.return_value = {
+        mock_handler = mock.Mock(
+            return_value={
                 "query": "test",
                 "mode": "keyword",
                 "results": [],
@@ -379,6 +433,10 @@ class TestSearchMemory:
                 "total_segments": 0,
                 "files_searched": 0,
             }
+        )
+        with mock.patch.dict(
+            "augent.mcp._TOOL_HANDLERS", {"search_memory": mock_handler}
+        ):
             resp = capture_stdout(
                 handle_tools_call,
                 1,
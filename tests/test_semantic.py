@@ -79,14 +79,16 @@ def query_embedding():
 def mock_embedding_model(query_embedding):
     """Mock sentence-transformer model that returns the deterministic query vector."""
     model = MagicMock()
-    model.encode = (
-        lambda text, convert_to_numpy=True, show_progress_bar=False: query_embedding
+    model.encode = lambda text, convert_to_numpy=True, show_progress_bar=False: (
+        np.stack([query_embedding] * len(text))
+        if isinstance(text, list)
+        else query_embedding
     )
     return model
 
 
 @pytest.fixture
-def deep_search_env(segments, embeddings, mock_embedding_model):
+def deep_search_env(segments, embeddings, query_embedding, mock_embedding_model):
     """Patch all external dependencies for deep_search calls."""
 
     class _MockMemory:
@@ -111,7 +113,14 @@ def deep_search_env(segments, embeddings, mock_embedding_model):
                 "cached": True,
             },
         ),
-        patch("augent.embeddings._get_or_compute_embeddings", return_value=embeddings),
+        patch(
+            "augent.embeddings._get_or_compute_embeddings",
+            side_effect=lambda segs, h, model_name=None, extra_texts=None: (
+                (embeddings, np.stack([query_embedding] * len(extra_texts)))
+                if extra_texts
+                else embeddings
+            ),
+        ),
         patch("augent.embeddings._get_embedding_model_cache") as mock_cache,
     ):
         mock_cache.return_value.get.return_value = mock_embedding_model
@@ -39,7 +39,8 @@ def capture_stdout(func, *args, **kwargs):
 
 class TestSpacesToolsList:
     def test_returns_22_tools(self):
-        resp = capture_stdout(handle_tools_list, 1)
+        with mock.patch("augent.mcp._unavailable_tools", return_value=frozenset()):
+            resp = capture_stdout(handle_tools_list, 1)
         tools = resp["result"]["tools"]
         assert len(tools) == 22
 
@@ -162,8 +163,8 @@ class TestSpacesValidation:
 
 class TestSpacesMCPRouting:
     def test_spaces_routes_through_tools_call(self):
-        with mock.patch("augent.mcp.handle_spaces") as mock_handler:
-            mock_handler.return_value = {"success": True, "recording_id": "abc"}
+        mock_handler = mock.Mock(return_value={"success": True, "recording_id": "abc"})
+        with mock.patch.dict("augent.mcp._TOOL_HANDLERS", {"spaces": mock_handler}):
             resp = capture_stdout(
                 handle_tools_call,
                 1,